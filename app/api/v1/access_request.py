@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Query, Body
+from fastapi import APIRouter, Query, Body, BackgroundTasks
 from typing import List
 from uuid import UUID
 
@@ -15,10 +15,11 @@ router = APIRouter(prefix="/access-requests", tags=["Access Requests"])
 def create_access_request(
     payload: AccessRequestCreate,
     service: AccessRequestService,
-    session: Session
+    session: Session,
+    background_tasks: BackgroundTasks
 ) -> AccessRequestResponse:
     """"""
-    return service.create_access_request(payload, session)
+    return service.create_access_request(payload, session, background_tasks)
 
 
 @router.get("/", response_model=List[AccessRequestResponse], status_code=200)
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Query, BackgroundTasks
 from typing import List
 from uuid import UUID
 
@@ -14,10 +14,11 @@ router = APIRouter(prefix="/incidents", tags=["Incidents"])
 def create_incident(
     payload: IncidentCreate,
     service: IncidentService,
-    session: Session
+    session: Session,
+    background_tasks: BackgroundTasks
 ) -> IncidentResponse:
     """"""
-    return service.create_incident(payload, session)
+    return service.create_incident(payload, session, background_tasks)
 
 
 @router.get("/", response_model=List[IncidentResponse], status_code=200)
@@ -69,10 +70,11 @@ def delete_incident(
 def start_incident(
     incident_id: UUID,
     service: IncidentService,
-    session: Session
+    session: Session,
+    background_tasks: BackgroundTasks
 ) -> IncidentResponse:
     """"""
-    return service.start_incident(incident_id, session)
+    return service.start_incident(incident_id, session, background_tasks)
 
 
 @router.patch("/{incident_id}/resolve", response_model=IncidentResponse, status_code=200)
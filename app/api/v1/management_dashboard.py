@@ -10,6 +10,7 @@ from sqlalchemy.orm import Session
 
 from app.database import Database
 from app.services.auth import CurrentUser
+from app.services.management_dashboard import ManagementDashboardService
 from app.models.user import User
 import os
 import shutil
@@ -34,23 +35,21 @@ def get_executive_sla_overview(
 ) -> dict:
     """Get executive SLA overview metrics - high-level KPIs for C-suite"""
     try:
-        with Database.session() as session:
-            result = session.execute(
-                text("SELECT * FROM v_executive_sla_overview LIMIT 1")
-            )
-            row = result.fetchone()
-            if not row:
-                return {
-                    "total_items": 0,
-                    "within_sla_count": 0,
-                    "at_risk_count": 0,
-                    "critical_count": 0,
-                    "breached_count": 0,
-                    "compliance_percentage": 0,
-                    "at_risk_percentage": 0,
-                    "last_updated": None
-                }
-            return row._mapping
+        return dict(ManagementDashboardService.get_executive_sla_overview())
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+# ============================================================
+# Landing page bundle
+# ============================================================
+@router.get("/landing")
+def get_landing_bundle(
+    current_user: CurrentUser
+) -> dict:
+    """Get the executive overview, regional analytics and critical alerts in one round-trip"""
+    try:
+        return ManagementDashboardService.get_landing_bundle()
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -65,40 +64,19 @@ def get_incident_sla_monitoring(
     region: Optional[str] = Query(None),
     status: Optional[str] = Query(None),
     offset: int = Query(0, ge=0),
-    limit: int = Query(50, ge=1, le=500)
+    limit: int = Query(50, ge=1, le=500),
+    count: bool = Query(True)
 ) -> dict:
     """Get incident SLA monitoring records with filtering support"""
     try:
-        with Database.session() as session:
-            query = "SELECT * FROM v_incident_sla_monitoring WHERE 1=1"
-            params = {}
-
-            if severity:
-                query += " AND severity = :severity"
-                params["severity"] = severity
-
-            if region:
-                query += " AND region = :region"
-                params["region"] = region
-
-            if status:
-                query += " AND sla_status = :status"
-                params["status"] = status
-
-            # Get total count
-            count_query = f"SELECT COUNT(*) as total FROM ({query}) AS subquery"
-            count_result = session.execute(text(count_query), params)
-            total = count_result.scalar() or 0
-
-            # Get paginated results
-            query += f" ORDER BY sla_deadline ASC LIMIT :limit OFFSET :offset"
-            params["limit"] = limit
-            params["offset"] = offset
-
-            result = session.execute(text(query), params)
-            records = [dict(row._mapping) for row in result]
-
-            return {"data": records, "total": total}
+        return ManagementDashboardService.get_incident_sla_monitoring({
+            "severity": severity,
+            "region": region,
+            "status": status,
+            "limit": limit,
+            "offset": offset,
+            "count": count,
+        })
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -115,10 +93,10 @@ def get_incident_sla_detail(
                 text("SELECT * FROM v_incident_sla_monitoring WHERE id = :id"),
                 {"id": incident_id}
             )
-            row = result.fetchone()
+            row = result.mappings().first()
             if not row:
                 raise HTTPException(status_code=404, detail="Incident not found")
-            return dict(row._mapping)
+            return dict(row)
     except HTTPException:
         raise
     except Exception as e:
@@ -147,6 +125,26 @@ def get_noc_online(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# ============================================================
+# Materialized view refresh (on demand; also runs on a timer from app.main)
+# ============================================================
+@router.post("/refresh-materialized-views")
+def refresh_materialized_views(
+    current_user: CurrentUser
+) -> dict:
+    """Refresh the dashboard materialized views (restricted to Manager/Admin)."""
+    from app.utils.enums import UserRole
+
+    if current_user.role not in (UserRole.MANAGER, UserRole.ADMIN):
+        raise HTTPException(status_code=403, detail="Insufficient permissions")
+
+    try:
+        refreshed = ManagementDashboardService.refresh_materialized_views()
+        return {"refreshed": refreshed, "timestamp": Database.get_current_timestamp()}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 # ============================================================
 # Task Performance & Compliance
 # ============================================================
@@ -157,40 +155,19 @@ def get_task_performance(
     region: Optional[str] = Query(None),
     status: Optional[str] = Query(None),
     offset: int = Query(0, ge=0),
-    limit: int = Query(50, ge=1, le=500)
+    limit: int = Query(50, ge=1, le=500),
+    count: bool = Query(True)
 ) -> dict:
     """Get task performance and compliance records"""
     try:
-        with Database.session() as session:
-            query = "SELECT * FROM v_task_performance_compliance WHERE 1=1"
-            params = {}
-
-            if task_type:
-                query += " AND task_type = :task_type"
-                params["task_type"] = task_type
-
-            if region:
-                query += " AND region = :region"
-                params["region"] = region
-
-            if status:
-                query += " AND sla_status = :status"
-                params["status"] = status
-
-            # Get total count
-            count_query = f"SELECT COUNT(*) as total FROM ({query}) AS subquery"
-            count_result = session.execute(text(count_query), params)
-            total = count_result.scalar() or 0
-
-            # Get paginated results
-            query += f" ORDER BY sla_deadline ASC LIMIT :limit OFFSET :offset"
-            params["limit"] = limit
-            params["offset"] = offset
-
-            result = session.execute(text(query), params)
-            records = [dict(row._mapping) for row in result]
-
-            return {"data": records, "total": total}
+        return ManagementDashboardService.get_task_performance({
+            "task_type": task_type,
+            "region": region,
+            "status": status,
+            "limit": limit,
+            "offset": offset,
+            "count": count,
+        })
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -207,10 +184,10 @@ def get_task_performance_detail(
                 text("SELECT * FROM v_task_performance_compliance WHERE id = :id"),
                 {"id": task_id}
             )
-            row = result.fetchone()
+            row = result.mappings().first()
             if not row:
                 raise HTTPException(status_code=404, detail="Task not found")
-            return dict(row._mapping)
+            return dict(row)
     except HTTPException:
         raise
     except Exception as e:
@@ -226,36 +203,18 @@ def get_site_risk_reliability(
     region: Optional[str] = Query(None),
     risk_level: Optional[str] = Query(None),
     offset: int = Query(0, ge=0),
-    limit: int = Query(50, ge=1, le=500)
+    limit: int = Query(50, ge=1, le=500),
+    count: bool = Query(True)
 ) -> dict:
     """Get site risk and reliability metrics"""
     try:
-        with Database.session() as session:
-            query = "SELECT * FROM v_site_risk_reliability WHERE 1=1"
-            params = {}
-
-            if region:
-                query += " AND region = :region"
-                params["region"] = region
-
-            if risk_level:
-                query += " AND risk_level = :risk_level"
-                params["risk_level"] = risk_level
-
-            # Get total count
-            count_query = f"SELECT COUNT(*) as total FROM ({query}) AS subquery"
-            count_result = session.execute(text(count_query), params)
-            total = count_result.scalar() or 0
-
-            # Get paginated results
-            query += f" ORDER BY incident_count DESC LIMIT :limit OFFSET :offset"
-            params["limit"] = limit
-            params["offset"] = offset
-
-            result = session.execute(text(query), params)
-            records = [dict(row._mapping) for row in result]
-
-            return {"data": records, "total": total}
+        return ManagementDashboardService.get_site_risk_reliability({
+            "region": region,
+            "risk_level": risk_level,
+            "limit": limit,
+            "offset": offset,
+            "count": count,
+        })
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -269,13 +228,13 @@ def get_site_risk_detail(
     try:
         with Database.session() as session:
             result = session.execute(
-                text("SELECT * FROM v_site_risk_reliability WHERE site_id = :id"),
+                text("SELECT * FROM mv_site_risk_reliability WHERE site_id = :id"),
                 {"id": site_id}
             )
-            row = result.fetchone()
+            row = result.mappings().first()
             if not row:
                 raise HTTPException(status_code=404, detail="Site not found")
-            return dict(row._mapping)
+            return dict(row)
     except HTTPException:
         raise
     except Exception as e:
@@ -291,36 +250,18 @@ def get_technician_performance(
     workload_level: Optional[str] = Query(None),
     performance_level: Optional[str] = Query(None),
     offset: int = Query(0, ge=0),
-    limit: int = Query(50, ge=1, le=500)
+    limit: int = Query(50, ge=1, le=500),
+    count: bool = Query(True)
 ) -> dict:
     """Get technician performance metrics (aggregate, non-punitive)"""
     try:
-        with Database.session() as session:
-            query = "SELECT * FROM v_technician_performance WHERE 1=1"
-            params = {}
-
-            if workload_level:
-                query += " AND workload_level = :workload_level"
-                params["workload_level"] = workload_level
-
-            if performance_level:
-                query += " AND performance_level = :performance_level"
-                params["performance_level"] = performance_level
-
-            # Get total count
-            count_query = f"SELECT COUNT(*) as total FROM ({query}) AS subquery"
-            count_result = session.execute(text(count_query), params)
-            total = count_result.scalar() or 0
-
-            # Get paginated results
-            query += f" ORDER BY total_workload DESC LIMIT :limit OFFSET :offset"
-            params["limit"] = limit
-            params["offset"] = offset
-
-            result = session.execute(text(query), params)
-            records = [dict(row._mapping) for row in result]
-
-            return {"data": records, "total": total}
+        return ManagementDashboardService.get_technician_performance({
+            "workload_level": workload_level,
+            "performance_level": performance_level,
+            "limit": limit,
+            "offset": offset,
+            "count": count,
+        })
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -334,13 +275,13 @@ def get_technician_performance_detail(
     try:
         with Database.session() as session:
             result = session.execute(
-                text("SELECT * FROM v_technician_performance WHERE technician_id = :id"),
+                text("SELECT * FROM mv_technician_performance WHERE technician_id = :id"),
                 {"id": technician_id}
             )
-            row = result.fetchone()
+            row = result.mappings().first()
             if not row:
                 raise HTTPException(status_code=404, detail="Technician not found")
-            return dict(row._mapping)
+            return dict(row)
     except HTTPException:
         raise
     except Exception as e:
@@ -356,36 +297,18 @@ def get_access_request_sla(
     region: Optional[str] = Query(None),
     status: Optional[str] = Query(None),
     offset: int = Query(0, ge=0),
-    limit: int = Query(50, ge=1, le=500)
+    limit: int = Query(50, ge=1, le=500),
+    count: bool = Query(True)
 ) -> dict:
     """Get access request SLA impact records"""
     try:
-        with Database.session() as session:
-            query = "SELECT * FROM v_access_request_sla_impact WHERE 1=1"
-            params = {}
-
-            if region:
-                query += " AND region = :region"
-                params["region"] = region
-
-            if status:
-                query += " AND sla_status = :status"
-                params["status"] = status
-
-            # Get total count
-            count_query = f"SELECT COUNT(*) as total FROM ({query}) AS subquery"
-            count_result = session.execute(text(count_query), params)
-            total = count_result.scalar() or 0
-
-            # Get paginated results
-            query += f" ORDER BY sla_deadline ASC LIMIT :limit OFFSET :offset"
-            params["limit"] = limit
-            params["offset"] = offset
-
-            result = session.execute(text(query), params)
-            records = [dict(row._mapping) for row in result]
-
-            return {"data": records, "total": total}
+        return ManagementDashboardService.get_access_request_sla({
+            "region": region,
+            "sla_status": status,
+            "limit": limit,
+            "offset": offset,
+            "count": count,
+        })
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -399,12 +322,10 @@ def get_regional_sla_analytics(
 ) -> dict:
     """Get regional SLA analytics and performance comparison"""
     try:
-        with Database.session() as session:
-            result = session.execute(
-                text("SELECT * FROM v_regional_sla_analytics ORDER BY overall_sla_compliance DESC NULLS LAST")
-            )
-            records = [dict(row._mapping) for row in result]
-            return {"data": records, "total": len(records)}
+        records = [dict(row) for row in ManagementDashboardService.get_regional_sla_analytics()]
+        # Best compliance first, regions without a figure last
+        records.sort(key=lambda r: (r["overall_sla_compliance"] is None, -(r["overall_sla_compliance"] or 0)))
+        return {"data": records, "total": len(records)}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -417,32 +338,17 @@ def get_sla_trend_analysis(
     current_user: CurrentUser,
     metric_type: Optional[str] = Query(None),
     offset: int = Query(0, ge=0),
-    limit: int = Query(90, ge=1, le=500)
+    limit: int = Query(90, ge=1, le=500),
+    count: bool = Query(True)
 ) -> dict:
     """Get historical SLA trend data (90-day window)"""
     try:
-        with Database.session() as session:
-            query = "SELECT * FROM v_sla_trend_analysis WHERE 1=1"
-            params = {}
-
-            if metric_type:
-                query += " AND metric_type = :metric_type"
-                params["metric_type"] = metric_type
-
-            # Get total count
-            count_query = f"SELECT COUNT(*) as total FROM ({query}) AS subquery"
-            count_result = session.execute(text(count_query), params)
-            total = count_result.scalar() or 0
-
-            # Get paginated results - ordered by date DESC (most recent first)
-            query += f" ORDER BY metric_date DESC LIMIT :limit OFFSET :offset"
-            params["limit"] = limit
-            params["offset"] = offset
-
-            result = session.execute(text(query), params)
-            records = [dict(row._mapping) for row in result]
-
-            return {"data": records, "total": total}
+        return ManagementDashboardService.get_sla_trend_analysis({
+            "metric_type": metric_type,
+            "limit": limit,
+            "offset": offset,
+            "count": count,
+        })
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -456,36 +362,18 @@ def get_sla_alerts(
     alert_level: Optional[str] = Query(None),
     item_type: Optional[str] = Query(None),
     offset: int = Query(0, ge=0),
-    limit: int = Query(100, ge=1, le=500)
+    limit: int = Query(100, ge=1, le=500),
+    count: bool = Query(True)
 ) -> dict:
     """Get real-time SLA alerts and escalation items"""
     try:
-        with Database.session() as session:
-            query = "SELECT * FROM v_sla_alerts_escalation WHERE 1=1"
-            params = {}
-
-            if alert_level:
-                query += " AND alert_level = :alert_level"
-                params["alert_level"] = alert_level
-
-            if item_type:
-                query += " AND item_type = :item_type"
-                params["item_type"] = item_type
-
-            # Get total count
-            count_query = f"SELECT COUNT(*) as total FROM ({query}) AS subquery"
-            count_result = session.execute(text(count_query), params)
-            total = count_result.scalar() or 0
-
-            # Get paginated results - ordered by priority
-            query += f" ORDER BY priority_order ASC, sla_deadline ASC LIMIT :limit OFFSET :offset"
-            params["limit"] = limit
-            params["offset"] = offset
-
-            result = session.execute(text(query), params)
-            records = [dict(row._mapping) for row in result]
-
-            return {"data": records, "total": total}
+        return ManagementDashboardService.get_sla_alerts({
+            "alert_level": alert_level,
+            "item_type": item_type,
+            "limit": limit,
+            "offset": offset,
+            "count": count,
+        })
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -39,6 +39,16 @@ def read_notifications(
     return service.read_notifications(session, priority, user_id, offset, limit)
 
 
+@router.get("/unread-count", status_code=200)
+def get_unread_count(
+    service: NotificationService,
+    session: Session,
+    current_user: CurrentUser
+) -> dict:
+    """Get the number of unread notifications for the current user."""
+    return {"count": service.get_unread_count(current_user.user_id, session)}
+
+
 @router.get("/{notification_id}", response_model=NotificationResponse, status_code=200)
 def read_notification(
     notification_id: UUID,
@@ -70,3 +80,13 @@ def mark_as_read(
 ) -> NotificationResponse:
     """Mark notification as read."""
     return service.read(notification_id, session)
+
+
+@router.patch("/read-all", status_code=200)
+def mark_all_as_read(
+    service: NotificationService,
+    session: Session,
+    current_user: CurrentUser
+) -> dict:
+    """Mark all of the current user's notifications as read."""
+    return {"updated": service.mark_all_as_read(current_user.user_id, session)}
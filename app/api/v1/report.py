@@ -102,10 +102,7 @@ def export_report_pdf(
     if current_user.role not in allowed_roles:
         raise UnauthorizedException("You do not have permission to export reports.")
     
-    pdf_buffer, filename = service.export_report_pdf(report_id, session)
-    
-    # Get the PDF bytes from the buffer
-    pdf_bytes = pdf_buffer.getvalue()
+    pdf_bytes, filename = service.export_report_pdf(report_id, session)
     
     return Response(
         content=pdf_bytes,
@@ -1,9 +1,11 @@
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Body, Query, BackgroundTasks
 from typing import List
 from uuid import UUID
+from datetime import datetime
 
 from app.models import TaskCreate, TaskUpdate, TaskResponse
 from app.services import TaskService
+from app.services.task import MAX_TASK_BATCH_SIZE
 from app.database import Session
 from app.utils.enums import TaskStatus, TaskType
 
@@ -14,10 +16,21 @@ router = APIRouter(prefix="/tasks", tags=["Tasks"])
 def create_task(
     payload: TaskCreate,
     service: TaskService,
-    session: Session
+    session: Session,
+    background_tasks: BackgroundTasks
 ) -> TaskResponse:
     """"""
-    return service.create_task(payload, session)
+    return service.create_task(payload, session, background_tasks)
+
+
+@router.post("/batch", response_model=List[TaskResponse], status_code=201)
+def create_tasks(
+    service: TaskService,
+    session: Session,
+    payload: List[TaskCreate] = Body(..., max_length=MAX_TASK_BATCH_SIZE)
+) -> List[TaskResponse]:
+    """"""
+    return service.create_tasks(payload, session)
 
 
 @router.get("/", response_model=List[TaskResponse], status_code=200)
@@ -28,10 +41,14 @@ def read_tasks(
     task_type: TaskType | None = Query(None),
     status: TaskStatus | None = Query(None),
     offset: int = Query(default=0, ge=0),
-    limit: int = Query(default=100, le=1000)
+    limit: int = Query(default=100, le=1000),
+    after_start_time: datetime | None = Query(None),
+    after_id: UUID | None = Query(None)
 ) -> List[TaskResponse]:
     """"""
-    return service.read_tasks(session, technician_id, task_type, status, offset, limit)
+    return service.read_tasks(
+        session, technician_id, task_type, status, offset, limit, after_start_time, after_id
+    )
 
 
 @router.get("/{task_id}", response_model=TaskResponse, status_code=200)
@@ -69,27 +86,30 @@ def delete_task(
 def start_task(
     task_id: UUID,
     service: TaskService,
-    session: Session
+    session: Session,
+    background_tasks: BackgroundTasks
 ) -> TaskResponse:
     """"""
-    return service.start_task(task_id, session)
+    return service.start_task(task_id, session, background_tasks)
 
 
 @router.patch("/{task_id}/complete", response_model=TaskResponse, status_code=200)
 def complete_task(
     task_id: UUID,
     service: TaskService,
-    session: Session
+    session: Session,
+    background_tasks: BackgroundTasks
 ) -> TaskResponse:
     """"""
-    return service.complete_task(task_id, session)
+    return service.complete_task(task_id, session, background_tasks)
 
 
 @router.patch("/{task_id}/fail", response_model=TaskResponse, status_code=200)
 def fail_task(
     task_id: UUID,
     service: TaskService,
-    session: Session
+    session: Session,
+    background_tasks: BackgroundTasks
 ) -> TaskResponse:
     """"""
-    return service.fail_task(task_id, session)
+    return service.fail_task(task_id, session, background_tasks)
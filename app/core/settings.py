@@ -11,6 +11,9 @@ class AppSettings(BaseSettings):
     DB_PASSWORD: str = ""
     DB_PORT: int = 0
     DB_NAME: str = ""
+    DB_POOL_SIZE: int = Field(default=20, description="Persistent connections kept in the engine pool")
+    DB_MAX_OVERFLOW: int = Field(default=10, description="Extra connections allowed above DB_POOL_SIZE under load")
+    DB_POOL_TIMEOUT: int = Field(default=30, description="Seconds to wait for a pooled connection before failing")
 
     # Supabase Storage
     SUPABASE_URL: str = ""
@@ -30,6 +33,14 @@ class AppSettings(BaseSettings):
     PRESENCE_REDIS_TTL_SECONDS: int = Field(default=300, description="How long (s) a heartbeat is considered valid in Redis")
     PRESENCE_PUBSUB_CHANNEL: str = Field(default="presence_events", description="Redis pubsub channel for presence events")
 
+    # ORM loading. When enabled, read paths that eager-load their relationships
+    # raise on any other lazy load instead of silently issuing extra queries.
+    STRICT_ORM_LOADING: bool = Field(default=False, description="Use raiseload('*') on eager-loaded read queries")
+
+    # Dashboard snapshots. The mv_* views come from scripts/04; enable the periodic
+    # REFRESH in one worker (or run it from a scheduler) rather than in every worker.
+    DASHBOARD_MV_REFRESH_ENABLED: bool = Field(default=False, description="Refresh the dashboard materialized views from this process")
+
     @field_validator("JWT_SECRET_KEY", mode="before")
     @classmethod
     def validate_jwt_secret(cls, v: str) -> str:
@@ -1,5 +1,6 @@
 from sqlmodel import SQLModel, Session as _Session, create_engine
 from sqlalchemy import Engine
+from sqlalchemy.orm import sessionmaker
 from loguru import logger as LOG
 from typing import Generator, List, Annotated
 from fastapi import Depends
@@ -13,6 +14,7 @@ class Database:
     """Database connection manager."""
 
     connection: Engine | None = None
+    session_factory: sessionmaker | None = None
 
     @classmethod
     def connect(cls, url: str) -> None:
@@ -25,10 +27,14 @@ class Database:
         try:
             cls.connection = create_engine(
                 url,
-                pool_size=10,
-                max_overflow=20,
+                pool_size=app_settings.DB_POOL_SIZE,
+                max_overflow=app_settings.DB_MAX_OVERFLOW,
+                pool_timeout=app_settings.DB_POOL_TIMEOUT,
                 pool_pre_ping=True,  # Verify connections before using them
+                pool_recycle=3600,  # Replace connections before server-side idle timeouts
+                insertmanyvalues_page_size=1000,  # Rows per multi-row INSERT for bulk notification fan-out
             )
+            cls.session_factory = sessionmaker(bind=cls.connection, class_=_Session)
             LOG.debug(f"Connected to {cls.connection.url.database} database.")
         except Exception as e:
             message: str = f"Failed to connect to the database: {e}"
@@ -45,6 +51,7 @@ class Database:
             db_name: str | None = cls.connection.url.database
             cls.connection.dispose()
             cls.connection = None
+            cls.session_factory = None
             LOG.debug(f"Disconnected from {db_name} database.")
         except Exception as e:
             message: str = f"Failed to disconnect from the database: {e}"
@@ -72,20 +79,20 @@ class Database:
     @classmethod
     def get_session(cls) -> Generator[_Session]:
         """Get a database session for request handling."""
-        if not cls.connection:
+        if not cls.session_factory:
             LOG.critical("Cannot get session. Database is not connected.")
             raise RuntimeError("Cannot get session. Database is not connected.")
-        with _Session(cls.connection) as session:
+        with cls.session_factory() as session:
             yield session
 
     @classmethod
     @contextmanager
     def session(cls):
         """Context manager for database sessions (non-dependency injection)."""
-        if not cls.connection:
+        if not cls.session_factory:
             LOG.critical("Cannot get session. Database is not connected.")
             raise RuntimeError("Cannot get session. Database is not connected.")
-        with _Session(cls.connection) as session:
+        with cls.session_factory() as session:
             yield session
 
     @classmethod
@@ -100,6 +100,23 @@ class ConflictException(HTTPException):
         super().__init__(status.HTTP_409_CONFLICT, message, headers)
 
 
+class UnprocessableEntityException(HTTPException):
+    """
+    Exception raised for HTTP 422 Unprocessable Content errors.
+    This exception is thrown when the request is well-formed but its values cannot be
+    processed together (e.g., a batch that is too large, incomplete pagination cursors).
+    Attributes:
+        status_code: HTTP status code 422 (Unprocessable Content)
+        message: Description of the validation error
+        headers: Optional dictionary of HTTP headers to include in the response
+    """
+
+    def __init__(
+        self, message: str = "unprocessable content", headers: dict[str, str] | None = None
+    ) -> None:
+        super().__init__(status.HTTP_422_UNPROCESSABLE_CONTENT, message, headers)
+
+
 class TooManyRequestsException(HTTPException):
     """
     Exception raised for HTTP 429 Too Many Requests errors.
@@ -257,6 +257,15 @@ class AlertFilters:
     limit: Optional[int] = 100
     offset: Optional[int] = 0
 
+def _uncounted(filters) -> dict:
+    """
+    Dashboard filters for list fields. The GraphQL list types carry no total,
+    so counting is skipped here; the REST list endpoints request the
+    COUNT(*) OVER () total by default and let clients opt out with count=false.
+    """
+    return {**(filters.__dict__ if filters else {}), "count": False}
+
+
 # Query
 @strawberry.type
 class Query:
@@ -279,7 +288,7 @@ class Query:
     @strawberry.field
     def incident_sla_monitoring(self, filters: Optional[IncidentSLAFilters] = None) -> List[IncidentSLARecord]:
         from app.services.management_dashboard import ManagementDashboardService
-        data = ManagementDashboardService.get_incident_sla_monitoring(filters.__dict__ if filters else {})
+        data = ManagementDashboardService.get_incident_sla_monitoring(_uncounted(filters))
         return [
             IncidentSLARecord(
                 id=str(row["id"]),
@@ -307,7 +316,7 @@ class Query:
     @strawberry.field
     def task_performance(self, filters: Optional[TaskPerformanceFilters] = None) -> List[TaskPerformanceRecord]:
         from app.services.management_dashboard import ManagementDashboardService
-        data = ManagementDashboardService.get_task_performance(filters.__dict__ if filters else {})
+        data = ManagementDashboardService.get_task_performance(_uncounted(filters))
         return [
             TaskPerformanceRecord(
                 id=str(row["id"]),
@@ -337,7 +346,7 @@ class Query:
     @strawberry.field
     def site_risk_reliability(self, filters: Optional[SiteRiskFilters] = None) -> List[SiteRiskReliabilityRecord]:
         from app.services.management_dashboard import ManagementDashboardService
-        data = ManagementDashboardService.get_site_risk_reliability(filters.__dict__ if filters else {})
+        data = ManagementDashboardService.get_site_risk_reliability(_uncounted(filters))
         return [
             SiteRiskReliabilityRecord(
                 site_id=row["site_id"],
@@ -362,7 +371,7 @@ class Query:
     @strawberry.field
     def technician_performance(self, filters: Optional[TechnicianPerformanceFilters] = None) -> List[TechnicianPerformanceRecord]:
         from app.services.management_dashboard import ManagementDashboardService
-        data = ManagementDashboardService.get_technician_performance(filters.__dict__ if filters else {})
+        data = ManagementDashboardService.get_technician_performance(_uncounted(filters))
         return [
             TechnicianPerformanceRecord(
                 technician_id=row["technician_id"],
@@ -400,7 +409,7 @@ class Query:
     @strawberry.field
     def access_request_sla(self, filters: Optional[AccessRequestFilters] = None) -> List[AccessRequestSLARecord]:
         from app.services.management_dashboard import ManagementDashboardService
-        data = ManagementDashboardService.get_access_request_sla(filters.__dict__ if filters else {})
+        data = ManagementDashboardService.get_access_request_sla(_uncounted(filters))
         return [
             AccessRequestSLARecord(
                 id=str(row["id"]),
@@ -444,7 +453,7 @@ class Query:
     @strawberry.field
     def sla_trend_analysis(self, filters: Optional[SLATrendFilters] = None) -> List[SLATrendRecord]:
         from app.services.management_dashboard import ManagementDashboardService
-        data = ManagementDashboardService.get_sla_trend_analysis(filters.__dict__ if filters else {})
+        data = ManagementDashboardService.get_sla_trend_analysis(_uncounted(filters))
         return [
             SLATrendRecord(
                 date=row["date"],
@@ -461,7 +470,7 @@ class Query:
     @strawberry.field
     def sla_alerts(self, filters: Optional[AlertFilters] = None) -> List[SLAAlertRecord]:
         from app.services.management_dashboard import ManagementDashboardService
-        data = ManagementDashboardService.get_sla_alerts(filters.__dict__ if filters else {})
+        data = ManagementDashboardService.get_sla_alerts(_uncounted(filters))
         return [
             SLAAlertRecord(
                 id=str(row["id"]),
@@ -41,6 +41,24 @@ async def sla_check_background_task():
         await asyncio.sleep(15 * 60)
 
 
+# Background task for dashboard snapshot refreshes
+async def materialized_view_refresh_task():
+    """Background task that periodically refreshes the dashboard materialized views."""
+    from loguru import logger as LOG
+    from app.services.management_dashboard import (
+        ManagementDashboardService,
+        MATERIALIZED_VIEW_REFRESH_SECONDS,
+    )
+    
+    while True:
+        await asyncio.sleep(MATERIALIZED_VIEW_REFRESH_SECONDS)
+        try:
+            # The refresh is blocking database work; keep it off the event loop
+            await asyncio.to_thread(ManagementDashboardService.refresh_materialized_views)
+        except Exception as e:
+            LOG.error(f"Materialized view refresh error: {e}")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     print("DEBUG: Starting lifespan")
@@ -57,10 +75,22 @@ async def lifespan(app: FastAPI):
     # Start SLA check background task
     # sla_task = asyncio.create_task(sla_check_background_task())
     
+    # Keep the dashboard materialized views fresh (opt-in, see DASHBOARD_MV_REFRESH_ENABLED)
+    refresh_task = None
+    if app_settings.DASHBOARD_MV_REFRESH_ENABLED:
+        refresh_task = asyncio.create_task(materialized_view_refresh_task())
+    
     print("DEBUG: Yielding lifespan")
     yield
     
     print("DEBUG: Lifespan exiting")
+    if refresh_task is not None:
+        refresh_task.cancel()
+        try:
+            await refresh_task
+        except asyncio.CancelledError:
+            pass
+    
     # Cancel background task on shutdown
     # sla_task.cancel()
     # try:
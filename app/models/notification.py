@@ -1,4 +1,4 @@
-from sqlmodel import SQLModel, Field, Relationship
+from sqlmodel import SQLModel, Field, Relationship, Index
 from typing import TYPE_CHECKING
 from uuid import UUID
 
@@ -18,6 +18,22 @@ class BaseNotification(SQLModel):
 
 class Notification(BaseDB, BaseNotification, table=True):
     __tablename__ = "notifications"  # type: ignore
+    __table_args__ = (
+        # A user's inbox, newest first (btree scans backwards for DESC)
+        Index(
+            "ix_notifications_user_created",
+            "user_id",
+            "created_at",
+            postgresql_where="deleted_at IS NULL",
+        ),
+        # Unread count and mark-all-as-read
+        Index(
+            "ix_notifications_unread",
+            "user_id",
+            "created_at",
+            postgresql_where="deleted_at IS NULL AND read = false",
+        ),
+    )
 
     read: bool = Field(default=False, nullable=False)
 
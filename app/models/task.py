@@ -1,7 +1,7 @@
 from uuid import UUID
 from typing import TYPE_CHECKING, List
 from datetime import datetime
-from sqlmodel import SQLModel, Field, DateTime, Column, Relationship
+from sqlmodel import SQLModel, Field, DateTime, Column, Relationship, Index
 from sqlalchemy.dialects.postgresql import JSONB
 from abc import ABC
 
@@ -30,6 +30,21 @@ class BaseTask(SQLModel, ABC):
 
 class Task(BaseDB, BaseTask, table=True):
     __tablename__ = "tasks" # type: ignore
+    __table_args__ = (
+        Index(
+            "ix_tasks_schedule",
+            "start_time",
+            "id",
+            postgresql_where="deleted_at IS NULL",
+        ),
+        Index(
+            "ix_tasks_technician_schedule",
+            "technician_id",
+            "start_time",
+            "id",
+            postgresql_where="deleted_at IS NULL",
+        ),
+    )
 
     status: TaskStatus = Field(default=TaskStatus.PENDING, nullable=False)
     completed_at: datetime | None = Field(default=None, sa_type=DateTime(timezone=True)) # type: ignore
@@ -1,11 +1,11 @@
 from uuid import UUID
-from fastapi import Depends
+from fastapi import Depends, BackgroundTasks
 from typing import List, Annotated
 from sqlmodel import Session, select
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy import and_
 
-from app.utils.enums import AccessRequestStatus, NotificationPriority, UserRole
+from app.utils.enums import AccessRequestStatus, NotificationPriority
+from app.utils.funcs import preview
 from app.models import (
     AccessRequest,
     AccessRequestCreate,
@@ -13,8 +13,8 @@ from app.models import (
     AccessRequestResponse,
     Site,
     Technician,
-    User,
     )
+from app.services.notification import _NotificationService
 from app.exceptions.http import (
     ConflictException,
     InternalServerErrorException,
@@ -22,6 +22,9 @@ from app.exceptions.http import (
 )
 
 
+_NOTIFICATION_SERVICE = _NotificationService()
+
+
 class _AccessRequestService:
     def access_request_to_response(self, access_request: AccessRequest) -> AccessRequestResponse:
         user = access_request.technician.user
@@ -34,7 +37,9 @@ class _AccessRequestService:
             site_name=access_request.site.name
             )
 
-    def create_access_request(self, data: AccessRequestCreate, session: Session) -> AccessRequestResponse:
+    def create_access_request(
+        self, data: AccessRequestCreate, session: Session, background_tasks: BackgroundTasks
+    ) -> AccessRequestResponse:
         # Handle site
         statement = select(Site).where(Site.id == data.site_id, Site.deleted_at.is_(None)) # type: ignore
         site: Site | None = session.exec(statement).first()
@@ -52,33 +57,6 @@ class _AccessRequestService:
             session.add(access_request)
             session.commit()
             session.refresh(access_request)
-            
-            # Notify all NOC operators about new access request
-            from app.services.notification import _NotificationService
-            notification_service = _NotificationService()
-            
-            noc_users = session.exec(
-                select(User).where(
-                    and_(
-                        User.role == UserRole.NOC,
-                        User.deleted_at.is_(None)
-                    )
-                )
-            ).all()
-            
-            tech_name = f"{technician.user.name} {technician.user.surname}"
-            description_preview = data.description[:60] if data.description else "No description"
-            
-            for noc_user in noc_users:
-                notification_service.create_notification_for_user(
-                    user_id=noc_user.id,
-                    title=f"Access Request: {site.name}",
-                    message=f"{tech_name} is requesting access to {site.name}. Description: {description_preview}{'...' if len(data.description or '') > 60 else ''}",
-                    priority=NotificationPriority.HIGH,
-                    session=session
-                )
-            
-            return self.access_request_to_response(access_request)
         except IntegrityError as e:
             session.rollback()
             raise ConflictException(f"Error creating access-request: {e.orig}")
@@ -86,6 +64,17 @@ class _AccessRequestService:
             session.rollback()
             raise InternalServerErrorException(f"Unexpected error creating access-request: {e}")
 
+        # Notify all NOC operators about new access request
+        tech_name = f"{technician.user.name} {technician.user.surname}"
+        background_tasks.add_task(
+            _NOTIFICATION_SERVICE.notify_noc,
+            f"Access Request: {site.name}",
+            f"{tech_name} is requesting access to {site.name}. Description: {preview(data.description, 60) or 'No description'}",
+            NotificationPriority.HIGH,
+        )
+
+        return self.access_request_to_response(access_request)
+
     def read_access_request(self, access_request_id: UUID, session: Session) -> AccessRequestResponse:
         access_request = self._get_access_request(access_request_id, session)
         return self.access_request_to_response(access_request)
@@ -163,12 +152,9 @@ class _AccessRequestService:
                     session.refresh(task)
             
             # Notify the technician that their access request was approved
-            from app.services.notification import _NotificationService
-            notification_service = _NotificationService()
-            
             site_name = access_request.site.name if access_request.site else "Unknown Site"
             
-            notification_service.create_notification_for_user(
+            _NOTIFICATION_SERVICE.create_notification_for_user(
                 user_id=access_request.technician.user_id,
                 title=f"Access Approved: {site_name}",
                 message=f"Your access request for {site_name} has been approved. SEACOM Ref No.: {seacom_ref}",
@@ -190,12 +176,9 @@ class _AccessRequestService:
             session.refresh(access_request)
             
             # Notify the technician that their access request was rejected
-            from app.services.notification import _NotificationService
-            notification_service = _NotificationService()
-            
             site_name = access_request.site.name if access_request.site else "Unknown Site"
             
-            notification_service.create_notification_for_user(
+            _NOTIFICATION_SERVICE.create_notification_for_user(
                 user_id=access_request.technician.user_id,
                 title=f"Access Rejected: {site_name}",
                 message=f"Your access request for {site_name} has been rejected. Please contact NOC for more information.",
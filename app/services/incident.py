@@ -1,13 +1,27 @@
+"""
+Incident Service
+
+Read queries eager-load exactly the relationships `incident_to_response` needs
+(see `_INCIDENT_LOADER_OPTIONS`). With `STRICT_ORM_LOADING` enabled, read-only
+paths also apply `raiseload("*")` so any other relationship access fails fast
+instead of adding a hidden query per row. Mutating paths never use it because
+relationships expired by `commit()` must still be able to reload.
+"""
+
 from uuid import UUID
-from fastapi import Depends
+from fastapi import Depends, BackgroundTasks
 from typing import List, Annotated
 from sqlmodel import Session, select
+from sqlalchemy import update
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy import and_
+from sqlalchemy.orm import selectinload, raiseload
 
-from app.utils.enums import IncidentStatus, NotificationPriority, UserRole
-from app.utils.funcs import utcnow
-from app.models import Incident, IncidentCreate, IncidentUpdate, IncidentResponse, Site, Technician, User, Client
+from app.utils.enums import IncidentStatus, NotificationPriority
+from app.utils.funcs import utcnow, preview
+from app.core.settings import app_settings
+from app.models import Incident, IncidentCreate, IncidentUpdate, IncidentResponse, Site, Technician, Client
+from app.services.user import get_noc_user_ids
+from app.services.notification import _NotificationService
 from app.exceptions.http import (
     ConflictException,
     InternalServerErrorException,
@@ -15,40 +29,96 @@ from app.exceptions.http import (
 )
 
 
+_NOTIFICATION_SERVICE = _NotificationService()
+
+# Relationships read by `incident_to_response`, loaded up-front to avoid per-row lazy loads.
+_INCIDENT_LOADER_OPTIONS = (
+    selectinload(Incident.technician).selectinload(Technician.user),  # type: ignore
+    selectinload(Incident.site),  # type: ignore
+    selectinload(Incident.client),  # type: ignore
+)
+
+
+# Read-only paths also refuse any other lazy load when STRICT_ORM_LOADING is set.
+_READ_LOADER_OPTIONS = (
+    (*_INCIDENT_LOADER_OPTIONS, raiseload("*")) if app_settings.STRICT_ORM_LOADING else _INCIDENT_LOADER_OPTIONS
+)
+
+# Base statements are immutable and built once; callers add filters generatively.
+_INCIDENT_STATEMENT = (
+    select(Incident).options(*_INCIDENT_LOADER_OPTIONS).where(Incident.deleted_at.is_(None))  # type: ignore
+)
+_READ_INCIDENT_STATEMENT = (
+    select(Incident).options(*_READ_LOADER_OPTIONS).where(Incident.deleted_at.is_(None))  # type: ignore
+)
+
+
+# NOT NULL incident columns. IncidentUpdate types them as optional, so an
+# explicit null for one of these is ignored rather than sent to the UPDATE.
+_REQUIRED_INCIDENT_FIELDS = frozenset({"description", "site_id", "technician_id"})
+
+
+def _incident_update_values(data: IncidentUpdate) -> dict:
+    """Column values for a PATCH: only the fields the client sent, where an
+    explicit null clears a nullable column and is dropped for a required one."""
+    return {
+        field: value
+        for field, value in data.model_dump(exclude_unset=True).items()
+        if value is not None or field not in _REQUIRED_INCIDENT_FIELDS
+    }
+
+
 class _IncidentService:
     def incident_to_response(self, incident: Incident) -> IncidentResponse:
         user = incident.technician.user
-        # Calculate num_attachments - attachments can be {files: [...]} or {}
-        attachments = incident.attachments or {}
-        num_attachments = len(attachments.get("files", [])) if isinstance(attachments, dict) else 0
+        # Calculate num_attachments - attachments can be {files: [...]}, {} or None
+        attachments = incident.attachments
+        files = attachments.get("files") if isinstance(attachments, dict) else None
+        num_attachments = len(files) if files else 0
         
-        # Get client info
-        client_name = ""
-        client_code = ""
-        if incident.client:
-            client_name = incident.client.name
-        # client_code is deprecated/removed
-        return IncidentResponse(
-            **incident.model_dump(),
+        # Get client info (client_code is deprecated/removed)
+        client_name = incident.client.name if incident.client else ""
+
+        # The row was validated on the way into the database, so build the
+        # response from the fields it needs without re-running validation.
+        return IncidentResponse.model_construct(
+            id=incident.id,
+            created_at=incident.created_at,
+            updated_at=incident.updated_at,
+            deleted_at=incident.deleted_at,
+            client_id=incident.client_id,
+            ref_no=incident.ref_no,
+            seacom_ref=incident.seacom_ref,
+            description=incident.description,
+            start_time=incident.start_time,
+            attachments=incident.attachments,
+            site_id=incident.site_id,
+            technician_id=incident.technician_id,
+            status=incident.status,
+            resolved_at=incident.resolved_at,
             site_name=incident.site.name,
             technician_fullname=f"{user.name} {user.surname}",
             client_name=client_name,
-            client_code=client_code,
             num_attachments=num_attachments
         )
 
-    def create_incident(self, data: IncidentCreate, session: Session) -> IncidentResponse:
-        # Handle site
-        statement = select(Site).where(Site.id == data.site_id, Site.deleted_at.is_(None)) # type: ignore
-        site: Site | None = session.exec(statement).first()
-        if not site:
-            raise NotFoundException("site not found")
-        
-        # Handle technician
-        statement = select(Technician).where(Technician.id == data.technician_id, Technician.deleted_at.is_(None)) # type: ignore
-        technician: Technician | None = session.exec(statement).first()
-        if not technician:
+    def create_incident(
+        self, data: IncidentCreate, session: Session, background_tasks: BackgroundTasks
+    ) -> IncidentResponse:
+        # Handle site and technician in a single round-trip
+        statement = select(Site, Technician).where(
+            Site.id == data.site_id,
+            Site.deleted_at.is_(None),  # type: ignore
+            Technician.id == data.technician_id,
+            Technician.deleted_at.is_(None),  # type: ignore
+        )
+        row = session.exec(statement).first()
+        if not row:
+            statement = select(Site.id).where(Site.id == data.site_id, Site.deleted_at.is_(None))  # type: ignore
+            if session.exec(statement).first() is None:
+                raise NotFoundException("site not found")
             raise NotFoundException("technician not found")
+        site, technician = row
 
         # Auto-set start_time to now if not provided
         incident_data = data.model_dump()
@@ -60,40 +130,6 @@ class _IncidentService:
             session.add(incident)
             session.commit()
             session.refresh(incident)
-            
-            # Create notifications
-            from app.services.notification import _NotificationService
-            notification_service = _NotificationService()
-            
-            # Notify the assigned technician about the incident
-            notification_service.create_notification_for_user(
-                user_id=technician.user_id,
-                title=f"Incident Assigned: {site.name}",
-                message=f"You have been assigned to handle an incident at {site.name}. {data.description[:80]}...",
-                priority=NotificationPriority.CRITICAL,
-                session=session
-            )
-            
-            # Notify all NOC operators about new incident
-            noc_users = session.exec(
-                select(User).where(
-                    and_(
-                        User.role == UserRole.NOC,
-                        User.deleted_at.is_(None)
-                    )
-                )
-            ).all()
-            
-            for noc_user in noc_users:
-                notification_service.create_notification_for_user(
-                    user_id=noc_user.id,
-                    title=f"New Incident Created",
-                    message=f"Incident created at {site.name}, assigned to {technician.user.name}. {data.description[:60]}...",
-                    priority=NotificationPriority.HIGH,
-                    session=session
-                )
-            
-            return self.incident_to_response(incident)
         except IntegrityError as e:
             session.rollback()
             raise ConflictException(f"Error creating incident: {e.orig}")
@@ -101,8 +137,24 @@ class _IncidentService:
             session.rollback()
             raise InternalServerErrorException(f"Unexpected error creating incident: {e}")
 
+        # Notify the assigned technician and all NOC operators after the response is sent
+        background_tasks.add_task(
+            _NOTIFICATION_SERVICE.notify_users,
+            [technician.user_id],
+            f"Incident Assigned: {site.name}",
+            f"You have been assigned to handle an incident at {site.name}. {preview(data.description, 80)}",
+            NotificationPriority.CRITICAL,
+        )
+        background_tasks.add_task(
+            _NOTIFICATION_SERVICE.notify_noc,
+            "New Incident Created",
+            f"Incident created at {site.name}, assigned to {technician.user.name}. {preview(data.description, 60)}",
+            NotificationPriority.HIGH,
+        )
+        return self.incident_to_response(incident)
+
     def read_incident(self, incident_id: UUID, session: Session) -> IncidentResponse:
-        incident = self._get_incident(incident_id, session)
+        incident = self._get_incident(incident_id, session, strict=True)
         return self.incident_to_response(incident)
 
     def read_incidents(
@@ -114,7 +166,7 @@ class _IncidentService:
         offset: int = 0,
         limit: int = 100,
     ) -> List[IncidentResponse]:
-        statement = select(Incident).where(Incident.deleted_at.is_(None))  # type: ignore
+        statement = _READ_INCIDENT_STATEMENT
 
         if technician_id is not None:
             statement = statement.where(Incident.technician_id == technician_id)
@@ -123,30 +175,34 @@ class _IncidentService:
         if client_id is not None:
             statement = statement.where(Incident.client_id == client_id)
 
-        statement = statement.offset(offset).limit(limit)
-        incidents = session.exec(statement).all()
-        return [self.incident_to_response(incident) for incident in incidents]
+        # Stream rows through a server-side cursor instead of materialising them all first
+        statement = statement.offset(offset).limit(limit).execution_options(yield_per=50)
+        to_response = self.incident_to_response
+        return [to_response(incident) for incident in session.exec(statement)]
 
     def update_incident(
         self, incident_id: UUID, data: IncidentUpdate, session: Session
     ) -> IncidentResponse:
-        incident = self._get_incident(incident_id, session)
-        update_data = data.model_dump(
-            exclude_none=True, exclude_defaults=True, exclude_unset=True
-        )
+        update_data = _incident_update_values(data)
 
         if not update_data:
-            return self.incident_to_response(incident)
-
-        for k, v in update_data.items():
-            setattr(incident, k, v)
+            return self.incident_to_response(self._get_incident(incident_id, session))
 
-        incident.touch()
+        # Update by primary key without loading the row first
+        statement = (
+            update(Incident)
+            .where(Incident.id == incident_id, Incident.deleted_at.is_(None))  # type: ignore
+            .values(**update_data, updated_at=utcnow())
+            .returning(Incident.id)
+        )
 
         try:
+            if session.execute(statement).scalar_one_or_none() is None:
+                raise NotFoundException("incident not found")
             session.commit()
-            session.refresh(incident)
-            return self.incident_to_response(incident)
+        except NotFoundException:
+            session.rollback()
+            raise
         except IntegrityError as e:
             session.rollback()
             raise ConflictException(f"Error updating incident: {e.orig}")
@@ -154,89 +210,73 @@ class _IncidentService:
             session.rollback()
             raise InternalServerErrorException(f"Unexpected error updating incident: {e}")
 
+        return self.incident_to_response(self._get_incident(incident_id, session))
+
     def delete_incident(self, incident_id: UUID, session: Session) -> None:
         incident = self._get_incident(incident_id, session)
         incident.soft_delete()
         session.commit()
     
-    def start_incident(self, incident_id: UUID, session: Session) -> IncidentResponse:
+    def start_incident(
+        self, incident_id: UUID, session: Session, background_tasks: BackgroundTasks
+    ) -> IncidentResponse:
         """Start working on an incident and notify NOC operators."""
         incident = self._get_incident(incident_id, session)
         incident.start()
+        site_name = incident.site.name if incident.site else "Unknown Site"
+        tech_name = f"{incident.technician.user.name} {incident.technician.user.surname}" if incident.technician else "Unknown"
+
+        # Every changed column is set in Python, so build the response before
+        # commit() expires the instance instead of re-selecting the row.
         try:
+            session.flush()
+            response = self.incident_to_response(incident)
             session.commit()
-            session.refresh(incident)
-            
-            # Notify NOC operators that incident work has started
-            from app.services.notification import _NotificationService
-            notification_service = _NotificationService()
-            
-            noc_users = session.exec(
-                select(User).where(
-                    and_(
-                        User.role == UserRole.NOC,
-                        User.deleted_at.is_(None)
-                    )
-                )
-            ).all()
-            
-            site_name = incident.site.name if incident.site else "Unknown Site"
-            tech_name = f"{incident.technician.user.name} {incident.technician.user.surname}" if incident.technician else "Unknown"
-            
-            for noc_user in noc_users:
-                notification_service.create_notification_for_user(
-                    user_id=noc_user.id,
-                    title=f"Incident In Progress: {site_name}",
-                    message=f"{tech_name} has started working on the incident at {site_name}",
-                    priority=NotificationPriority.NORMAL,
-                    session=session
-                )
-            
-            return self.incident_to_response(incident)
         except Exception as e:
             session.rollback()
             raise InternalServerErrorException(f"Unexpected error starting incident: {e}")
+
+        # Notify NOC operators that incident work has started
+        background_tasks.add_task(
+            _NOTIFICATION_SERVICE.notify_noc,
+            f"Incident In Progress: {site_name}",
+            f"{tech_name} has started working on the incident at {site_name}",
+            NotificationPriority.NORMAL,
+        )
+        return response
     
     def resolve_incident(self, incident_id: UUID, session: Session) -> IncidentResponse:
-        """Resolve an incident and notify NOC operators."""
+        """Resolve an incident and notify NOC operators in the same transaction."""
         incident = self._get_incident(incident_id, session)
+        noc_user_ids = get_noc_user_ids(session)
         incident.resolve()
+        site_name = incident.site.name if incident.site else "Unknown Site"
+        tech_name = f"{incident.technician.user.name} {incident.technician.user.surname}" if incident.technician else "Unknown"
+
+        # The resolution and the NOC notifications commit (or roll back) together.
+        # Every changed column is set in Python, so build the response before
+        # commit() expires the instance instead of re-selecting the row.
         try:
+            session.flush()
+            _NOTIFICATION_SERVICE.add_notifications_for_users(
+                user_ids=noc_user_ids,
+                title=f"Incident Resolved: {site_name}",
+                message=f"{tech_name} has resolved the incident at {site_name}",
+                priority=NotificationPriority.HIGH,
+                session=session
+            )
+            response = self.incident_to_response(incident)
             session.commit()
-            session.refresh(incident)
-            
-            # Notify NOC operators that incident is resolved
-            from app.services.notification import _NotificationService
-            notification_service = _NotificationService()
-            
-            noc_users = session.exec(
-                select(User).where(
-                    and_(
-                        User.role == UserRole.NOC,
-                        User.deleted_at.is_(None)
-                    )
-                )
-            ).all()
-            
-            site_name = incident.site.name if incident.site else "Unknown Site"
-            tech_name = f"{incident.technician.user.name} {incident.technician.user.surname}" if incident.technician else "Unknown"
-            
-            for noc_user in noc_users:
-                notification_service.create_notification_for_user(
-                    user_id=noc_user.id,
-                    title=f"Incident Resolved: {site_name}",
-                    message=f"{tech_name} has resolved the incident at {site_name}",
-                    priority=NotificationPriority.HIGH,
-                    session=session
-                )
-            
-            return self.incident_to_response(incident)
         except Exception as e:
             session.rollback()
             raise InternalServerErrorException(f"Unexpected error resolving incident: {e}")
 
-    def _get_incident(self, incident_id: UUID, session: Session) -> Incident:
-        statement = select(Incident).where(Incident.id == incident_id, Incident.deleted_at.is_(None))  # type: ignore
+        return response
+
+    def _get_incident(self, incident_id: UUID, session: Session, strict: bool = False) -> Incident:
+        """Load an incident with its response relationships; `strict` is for read-only callers."""
+        base = _READ_INCIDENT_STATEMENT if strict else _INCIDENT_STATEMENT
+        statement = base.where(Incident.id == incident_id)
         incident: Incident | None = session.exec(statement).first()
         if not incident:
             raise NotFoundException("incident not found")
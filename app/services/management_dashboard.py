@@ -3,322 +3,358 @@ Management Dashboard Service
 Provides access to SLA monitoring views and metrics
 """
 
-from typing import List, Dict, Any, Optional
-from sqlalchemy import text
+import time
+from functools import lru_cache, wraps
+from typing import List, Dict, Any, Optional, Callable, Tuple
+from sqlalchemy import text, TextClause
 from app.database import Database
 
+# Parameterless landing-page aggregates are cached in-process for a short TTL;
+# seconds-old SLA figures are acceptable on the dashboard.
+OVERVIEW_CACHE_TTL_SECONDS: float = 30.0
+_overview_cache: Dict[str, Tuple[float, Any]] = {}
+
+# How often app.main's background task rebuilds the mv_* dashboard snapshots
+MATERIALIZED_VIEW_REFRESH_SECONDS: float = 60.0
+
+
+def _ttl_cached(key: str) -> Callable[[Callable[[], Any]], Callable[[], Any]]:
+    """Cache the result of a parameterless loader under `key` for the overview TTL."""
+    def decorator(loader: Callable[[], Any]) -> Callable[[], Any]:
+        @wraps(loader)
+        def wrapper() -> Any:
+            now = time.monotonic()
+            entry = _overview_cache.get(key)
+            if entry is not None and now < entry[0]:
+                return entry[1]
+            value = loader()
+            _overview_cache[key] = (now + OVERVIEW_CACHE_TTL_SECONDS, value)
+            return value
+        return wrapper
+    return decorator
+
+
+def invalidate_overview_cache() -> None:
+    """Drop cached overview aggregates so the next read hits the views."""
+    _overview_cache.clear()
+
+
+# Aggregate views served from materialized snapshots (see
+# scripts/04_create_dashboard_materialized_views.sql). Each has a unique index,
+# so they can be refreshed CONCURRENTLY without blocking dashboard reads.
+MATERIALIZED_VIEWS: Tuple[str, ...] = (
+    "mv_executive_sla_overview",
+    "mv_regional_sla_analytics",
+    "mv_site_risk_reliability",
+    "mv_technician_performance",
+    "mv_sla_trend_analysis",
+)
+
+
+_EMPTY_EXECUTIVE_OVERVIEW: Dict[str, Any] = {
+    "total_items": 0,
+    "within_sla_count": 0,
+    "at_risk_count": 0,
+    "critical_count": 0,
+    "breached_count": 0,
+    "compliance_percentage": 0.0,
+    "at_risk_percentage": 0.0,
+    "last_updated": ""
+}
+
+# Every landing-page card in one round-trip, each card as a JSON column.
+LANDING_ALERTS_LIMIT: int = 20
+_LANDING_BUNDLE_QUERY = text(
+    "SELECT"
+    " (SELECT row_to_json(o) FROM mv_executive_sla_overview o LIMIT 1) AS overview,"
+    " (SELECT COALESCE(json_agg(r ORDER BY r.region), '[]'::json)"
+    "    FROM mv_regional_sla_analytics r) AS regional,"
+    " (SELECT COALESCE(json_agg(a), '[]'::json) FROM ("
+    "    SELECT * FROM v_sla_alerts_escalation WHERE alert_level = 'CRITICAL'"
+    "    ORDER BY sla_deadline LIMIT :alerts_limit) a) AS alerts"
+)
+
+
+# Per-view filters as (filter key, view column, operator). The filter key
+# doubles as the bind parameter name.
+_FilterMap = Tuple[Tuple[str, str, str], ...]
+
+_INCIDENT_SLA_FILTERS: _FilterMap = (
+    ("severity", "severity", "="),
+    ("region", "region", "="),
+    ("status", "sla_status", "="),
+    ("incident_status", "incident_status", "="),
+    ("from_date", "created_at", ">="),
+    ("to_date", "created_at", "<="),
+)
+_TASK_PERFORMANCE_FILTERS: _FilterMap = (
+    ("task_type", "task_type", "="),
+    ("task_status", "task_status", "="),
+    ("region", "region", "="),
+    ("status", "sla_status", "="),
+    ("from_date", "created_at", ">="),
+    ("to_date", "created_at", "<="),
+)
+_SITE_RISK_FILTERS: _FilterMap = (
+    ("region", "region", "="),
+    ("risk_level", "risk_level", "="),
+    ("site_status", "site_status", "="),
+)
+_TECHNICIAN_PERFORMANCE_FILTERS: _FilterMap = (
+    ("workload_level", "workload_level", "="),
+    ("performance_level", "performance_level", "="),
+)
+_ACCESS_REQUEST_SLA_FILTERS: _FilterMap = (
+    ("region", "region", "="),
+    ("status", "request_status", "="),
+    ("sla_status", "sla_status", "="),
+    ("from_date", "created_at", ">="),
+    ("to_date", "created_at", "<="),
+)
+_SLA_TREND_FILTERS: _FilterMap = (
+    ("metric_type", "metric_type", "="),
+    ("from_date", "metric_date", ">="),
+    ("to_date", "metric_date", "<="),
+)
+_SLA_ALERT_FILTERS: _FilterMap = (
+    ("alert_level", "alert_level", "="),
+    ("item_type", "item_type", "="),
+)
+
+
+def _where(filter_map: _FilterMap, filters: Dict[str, Any]) -> Tuple[List[str], Dict[str, Any]]:
+    """Build the WHERE conditions and bind parameters for the filters that are set."""
+    conditions: List[str] = []
+    params: Dict[str, Any] = {}
+    for key, column, op in filter_map:
+        value = filters.get(key)
+        if value:
+            conditions.append(f"{column} {op} :{key}")
+            params[key] = value
+    return conditions, params
+
+
+@lru_cache(maxsize=256)
+def _build_page_statements(
+    view: str, conditions: Tuple[str, ...], order_by: str
+) -> Tuple[TextClause, TextClause, TextClause]:
+    """Build (page, count, uncounted page) statements for a view once per filter combination.
+
+    Filter values are always bound parameters, so the set of distinct
+    statements is small and the compiled `text()` objects can be reused.
+    """
+    where = " WHERE " + " AND ".join(conditions) if conditions else ""
+    page = text(
+        f"SELECT *, COUNT(*) OVER () AS _total FROM {view}{where}"
+        f" ORDER BY {order_by} LIMIT :_limit OFFSET :_offset"
+    )
+    count = text(f"SELECT COUNT(*) FROM {view}{where}")
+    uncounted = text(f"SELECT * FROM {view}{where} ORDER BY {order_by} LIMIT :_limit OFFSET :_offset")
+    return page, count, uncounted
+
+
+def _paginated_view(
+    view: str,
+    conditions: List[str],
+    params: Dict[str, Any],
+    order_by: str,
+    limit: int,
+    offset: int,
+    count: bool = True,
+) -> Dict[str, Any]:
+    """Fetch one page of a dashboard view together with the filtered total.
+
+    The total comes from `COUNT(*) OVER ()` on the same scan, so the view is
+    only evaluated once per request. With `count=False` no total is computed;
+    one extra row is fetched instead to report `has_next`.
+    """
+    # Conditions are ANDed, so their order doesn't matter for the cache key
+    page_query, count_query, uncounted_query = _build_page_statements(
+        view, tuple(sorted(conditions)), order_by
+    )
+    limit = int(limit)
+    # Bound (not interpolated) so one statement serves every page; int() keeps
+    # the validation the old f-string formatting implied.
+    page_params = {**params, "_limit": limit, "_offset": int(offset)}
+
+    with Database.session() as session:
+        if not count:
+            page_params["_limit"] = limit + 1
+            rows = session.execute(uncounted_query, page_params).mappings().all()
+            return {
+                "data": [dict(row) for row in rows[:limit]],
+                "total": None,
+                "has_next": len(rows) > limit
+            }
+
+        rows = session.execute(page_query, page_params).mappings().all()
+        if rows:
+            total = rows[0]["_total"]
+        elif offset:
+            # Past the last page there are no rows to carry the window count
+            total = session.execute(count_query, params).scalar()
+        else:
+            total = 0
+
+        return {
+            "data": [{k: v for k, v in row.items() if k != "_total"} for row in rows],
+            "total": total
+        }
+
 
 class ManagementDashboardService:
     @staticmethod
+    def refresh_materialized_views() -> List[str]:
+        """Rebuild the dashboard snapshots and drop the cached overviews."""
+        with Database.session() as session:
+            for view in MATERIALIZED_VIEWS:
+                session.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {view}"))
+            session.commit()
+        invalidate_overview_cache()
+        return list(MATERIALIZED_VIEWS)
+
+    @staticmethod
+    @_ttl_cached("executive_sla_overview")
     def get_executive_sla_overview() -> Dict[str, Any]:
         """Get executive SLA overview metrics"""
         with Database.session() as session:
-            result = session.execute(text("SELECT * FROM v_executive_sla_overview LIMIT 1"))
-            row = result.fetchone()
+            row = session.execute(text("SELECT * FROM mv_executive_sla_overview LIMIT 1")).mappings().first()
             if not row:
-                return {
-                    "total_items": 0,
-                    "within_sla_count": 0,
-                    "at_risk_count": 0,
-                    "critical_count": 0,
-                    "breached_count": 0,
-                    "compliance_percentage": 0.0,
-                    "at_risk_percentage": 0.0,
-                    "last_updated": ""
-                }
-            return dict(row)
+                return dict(_EMPTY_EXECUTIVE_OVERVIEW)
+            return row  # type: ignore[return-value]
 
     @staticmethod
     def get_incident_sla_monitoring(filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Get incident SLA monitoring data"""
         filters = filters or {}
-        query = "SELECT * FROM v_incident_sla_monitoring"
-        conditions = []
-        params = {}
-
-        if filters.get("severity"):
-            conditions.append("severity = :severity")
-            params["severity"] = filters["severity"]
-        if filters.get("region"):
-            conditions.append("region = :region")
-            params["region"] = filters["region"]
-        if filters.get("status"):
-            conditions.append("sla_status = :status")
-            params["status"] = filters["status"]
-        if filters.get("incident_status"):
-            conditions.append("incident_status = :incident_status")
-            params["incident_status"] = filters["incident_status"]
-        if filters.get("from_date"):
-            conditions.append("created_at >= :from_date")
-            params["from_date"] = filters["from_date"]
-        if filters.get("to_date"):
-            conditions.append("created_at <= :to_date")
-            params["to_date"] = filters["to_date"]
-
-        if conditions:
-            query += " WHERE " + " AND ".join(conditions)
-
-        limit = filters.get("limit", 100)
-        offset = filters.get("offset", 0)
-        query += f" ORDER BY sla_percentage_used DESC LIMIT {limit} OFFSET {offset}"
-
-        with Database.session() as session:
-            result = session.execute(text(query), params)
-            rows = result.fetchall()
-            total_query = f"SELECT COUNT(*) FROM v_incident_sla_monitoring"
-            if conditions:
-                total_query += " WHERE " + " AND ".join(conditions)
-            total_result = session.execute(text(total_query), params)
-            total = total_result.scalar()
-
-            return {
-                "data": [dict(row) for row in rows],
-                "total": total
-            }
+        conditions, params = _where(_INCIDENT_SLA_FILTERS, filters)
+
+        return _paginated_view(
+            "v_incident_sla_monitoring",
+            conditions,
+            params,
+            order_by="sla_deadline ASC",
+            limit=filters.get("limit", 100),
+            offset=filters.get("offset", 0),
+            count=filters.get("count", True),
+        )
 
     @staticmethod
     def get_task_performance(filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Get task performance data"""
         filters = filters or {}
-        query = "SELECT * FROM v_task_performance"
-        conditions = []
-        params = {}
-
-        if filters.get("task_type"):
-            conditions.append("task_type = :task_type")
-            params["task_type"] = filters["task_type"]
-        if filters.get("task_status"):
-            conditions.append("task_status = :task_status")
-            params["task_status"] = filters["task_status"]
-        if filters.get("region"):
-            conditions.append("region = :region")
-            params["region"] = filters["region"]
-        if filters.get("status"):
-            conditions.append("sla_status = :status")
-            params["status"] = filters["status"]
-        if filters.get("from_date"):
-            conditions.append("created_at >= :from_date")
-            params["from_date"] = filters["from_date"]
-        if filters.get("to_date"):
-            conditions.append("created_at <= :to_date")
-            params["to_date"] = filters["to_date"]
-
-        if conditions:
-            query += " WHERE " + " AND ".join(conditions)
-
-        limit = filters.get("limit", 100)
-        offset = filters.get("offset", 0)
-        query += f" ORDER BY sla_percentage_used DESC LIMIT {limit} OFFSET {offset}"
-
-        with Database.session() as session:
-            result = session.execute(text(query), params)
-            rows = result.fetchall()
-            total_query = f"SELECT COUNT(*) FROM v_task_performance"
-            if conditions:
-                total_query += " WHERE " + " AND ".join(conditions)
-            total_result = session.execute(text(total_query), params)
-            total = total_result.scalar()
-
-            return {
-                "data": [dict(row) for row in rows],
-                "total": total
-            }
+        conditions, params = _where(_TASK_PERFORMANCE_FILTERS, filters)
+
+        return _paginated_view(
+            "v_task_performance_compliance",
+            conditions,
+            params,
+            order_by="sla_deadline ASC",
+            limit=filters.get("limit", 100),
+            offset=filters.get("offset", 0),
+            count=filters.get("count", True),
+        )
 
     @staticmethod
     def get_site_risk_reliability(filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Get site risk and reliability data"""
         filters = filters or {}
-        query = "SELECT * FROM v_site_risk_reliability"
-        conditions = []
-        params = {}
-
-        if filters.get("region"):
-            conditions.append("region = :region")
-            params["region"] = filters["region"]
-        if filters.get("risk_level"):
-            conditions.append("risk_level = :risk_level")
-            params["risk_level"] = filters["risk_level"]
-        if filters.get("site_status"):
-            conditions.append("site_status = :site_status")
-            params["site_status"] = filters["site_status"]
-
-        if conditions:
-            query += " WHERE " + " AND ".join(conditions)
-
-        limit = filters.get("limit", 100)
-        offset = filters.get("offset", 0)
-        query += f" ORDER BY risk_level DESC, sla_compliance_percentage ASC LIMIT {limit} OFFSET {offset}"
-
-        with Database.session() as session:
-            result = session.execute(text(query), params)
-            rows = result.fetchall()
-            total_query = f"SELECT COUNT(*) FROM v_site_risk_reliability"
-            if conditions:
-                total_query += " WHERE " + " AND ".join(conditions)
-            total_result = session.execute(text(total_query), params)
-            total = total_result.scalar()
-
-            return {
-                "data": [dict(row) for row in rows],
-                "total": total
-            }
+        conditions, params = _where(_SITE_RISK_FILTERS, filters)
+
+        return _paginated_view(
+            "mv_site_risk_reliability",
+            conditions,
+            params,
+            order_by="incident_count DESC",
+            limit=filters.get("limit", 100),
+            offset=filters.get("offset", 0),
+            count=filters.get("count", True),
+        )
 
     @staticmethod
     def get_technician_performance(filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Get technician performance data"""
         filters = filters or {}
-        query = "SELECT * FROM v_technician_performance"
-        conditions = []
-        params = {}
-
-        if filters.get("workload_level"):
-            conditions.append("workload_level = :workload_level")
-            params["workload_level"] = filters["workload_level"]
-        if filters.get("performance_level"):
-            conditions.append("performance_level = :performance_level")
-            params["performance_level"] = filters["performance_level"]
-
-        if conditions:
-            query += " WHERE " + " AND ".join(conditions)
-
-        limit = filters.get("limit", 100)
-        offset = filters.get("offset", 0)
-        query += f" ORDER BY workload_level DESC, performance_level ASC LIMIT {limit} OFFSET {offset}"
-
-        with Database.session() as session:
-            result = session.execute(text(query), params)
-            rows = result.fetchall()
-            total_query = f"SELECT COUNT(*) FROM v_technician_performance"
-            if conditions:
-                total_query += " WHERE " + " AND ".join(conditions)
-            total_result = session.execute(text(total_query), params)
-            total = total_result.scalar()
-
-            return {
-                "data": [dict(row) for row in rows],
-                "total": total
-            }
+        conditions, params = _where(_TECHNICIAN_PERFORMANCE_FILTERS, filters)
+
+        return _paginated_view(
+            "mv_technician_performance",
+            conditions,
+            params,
+            order_by="total_workload DESC",
+            limit=filters.get("limit", 100),
+            offset=filters.get("offset", 0),
+            count=filters.get("count", True),
+        )
 
     @staticmethod
     def get_access_request_sla(filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Get access request SLA data"""
         filters = filters or {}
-        query = "SELECT * FROM v_access_request_sla"
-        conditions = []
-        params = {}
-
-        if filters.get("status"):
-            conditions.append("request_status = :status")
-            params["status"] = filters["status"]
-        if filters.get("from_date"):
-            conditions.append("created_at >= :from_date")
-            params["from_date"] = filters["from_date"]
-        if filters.get("to_date"):
-            conditions.append("created_at <= :to_date")
-            params["to_date"] = filters["to_date"]
-
-        if conditions:
-            query += " WHERE " + " AND ".join(conditions)
-
-        limit = filters.get("limit", 100)
-        offset = filters.get("offset", 0)
-        query += f" ORDER BY sla_percentage_used DESC LIMIT {limit} OFFSET {offset}"
+        conditions, params = _where(_ACCESS_REQUEST_SLA_FILTERS, filters)
+
+        return _paginated_view(
+            "v_access_request_sla_impact",
+            conditions,
+            params,
+            order_by="sla_deadline ASC",
+            limit=filters.get("limit", 100),
+            offset=filters.get("offset", 0),
+            count=filters.get("count", True),
+        )
 
+    @staticmethod
+    @_ttl_cached("landing_bundle")
+    def get_landing_bundle() -> Dict[str, Any]:
+        """Get the executive overview, regional analytics and critical alerts in one query"""
         with Database.session() as session:
-            result = session.execute(text(query), params)
-            rows = result.fetchall()
-            total_query = f"SELECT COUNT(*) FROM v_access_request_sla"
-            if conditions:
-                total_query += " WHERE " + " AND ".join(conditions)
-            total_result = session.execute(text(total_query), params)
-            total = total_result.scalar()
-
+            row = session.execute(
+                _LANDING_BUNDLE_QUERY, {"alerts_limit": LANDING_ALERTS_LIMIT}
+            ).mappings().one()
             return {
-                "data": [dict(row) for row in rows],
-                "total": total
+                "overview": row["overview"] or dict(_EMPTY_EXECUTIVE_OVERVIEW),
+                "regional": row["regional"],
+                "alerts": row["alerts"],
             }
 
     @staticmethod
+    @_ttl_cached("regional_sla_analytics")
     def get_regional_sla_analytics() -> List[Dict[str, Any]]:
         """Get regional SLA analytics"""
         with Database.session() as session:
-            result = session.execute(text("SELECT * FROM v_regional_sla_analytics ORDER BY region"))
-            rows = result.fetchall()
-            return [dict(row) for row in rows]
+            # Read-only RowMappings; the GraphQL resolvers only index into them.
+            return session.execute(  # type: ignore[return-value]
+                text("SELECT * FROM mv_regional_sla_analytics ORDER BY region")
+            ).mappings().all()
 
     @staticmethod
     def get_sla_trend_analysis(filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Get SLA trend analysis data"""
         filters = filters or {}
-        query = "SELECT * FROM v_sla_trend_analysis"
-        conditions = []
-        params = {}
-
-        if filters.get("region"):
-            conditions.append("region = :region")
-            params["region"] = filters["region"]
-        if filters.get("from_date"):
-            conditions.append("date >= :from_date")
-            params["from_date"] = filters["from_date"]
-        if filters.get("to_date"):
-            conditions.append("date <= :to_date")
-            params["to_date"] = filters["to_date"]
-
-        if conditions:
-            query += " WHERE " + " AND ".join(conditions)
-
-        limit = filters.get("limit", 100)
-        query += f" ORDER BY date DESC LIMIT {limit}"
-
-        with Database.session() as session:
-            result = session.execute(text(query), params)
-            rows = result.fetchall()
-            total_query = f"SELECT COUNT(*) FROM v_sla_trend_analysis"
-            if conditions:
-                total_query += " WHERE " + " AND ".join(conditions)
-            total_result = session.execute(text(total_query), params)
-            total = total_result.scalar()
-
-            return {
-                "data": [dict(row) for row in rows],
-                "total": total
-            }
+        conditions, params = _where(_SLA_TREND_FILTERS, filters)
+
+        return _paginated_view(
+            "mv_sla_trend_analysis",
+            conditions,
+            params,
+            order_by="metric_date DESC",
+            limit=filters.get("limit", 100),
+            offset=filters.get("offset", 0),
+            count=filters.get("count", True),
+        )
 
     @staticmethod
     def get_sla_alerts(filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Get SLA alerts"""
         filters = filters or {}
-        query = "SELECT * FROM v_sla_alerts_escalation"
-        conditions = []
-        params = {}
-
-        if filters.get("alert_level"):
-            conditions.append("alert_level = :alert_level")
-            params["alert_level"] = filters["alert_level"]
-        if filters.get("item_type"):
-            conditions.append("item_type = :item_type")
-            params["item_type"] = filters["item_type"]
-        if filters.get("region"):
-            conditions.append("region = :region")
-            params["region"] = filters["region"]
-
-        if conditions:
-            query += " WHERE " + " AND ".join(conditions)
-
-        limit = filters.get("limit", 100)
-        offset = filters.get("offset", 0)
-        query += f" ORDER BY alert_level DESC, created_at DESC LIMIT {limit} OFFSET {offset}"
-
-        with Database.session() as session:
-            result = session.execute(text(query), params)
-            rows = result.fetchall()
-            total_query = f"SELECT COUNT(*) FROM v_sla_alerts_escalation"
-            if conditions:
-                total_query += " WHERE " + " AND ".join(conditions)
-            total_result = session.execute(text(total_query), params)
-            total = total_result.scalar()
-
-            return {
-                "data": [dict(row) for row in rows],
-                "total": total
-            }
\ No newline at end of file
+        conditions, params = _where(_SLA_ALERT_FILTERS, filters)
+
+        return _paginated_view(
+            "v_sla_alerts_escalation",
+            conditions,
+            params,
+            order_by="priority_order ASC, sla_deadline ASC",
+            limit=filters.get("limit", 100),
+            offset=filters.get("offset", 0),
+            count=filters.get("count", True),
+        )
\ No newline at end of file
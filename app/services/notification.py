@@ -1,11 +1,15 @@
-from uuid import UUID
+from uuid import UUID, uuid4
 from fastapi import Depends
-from typing import List, Annotated
+from typing import List, Annotated, Iterable, Sequence
 from sqlmodel import Session, select
+from sqlalchemy import insert, update, func, bindparam, literal
 from sqlalchemy.exc import IntegrityError
 
 from app.utils.enums import NotificationPriority
+from app.utils.funcs import utcnow
+from app.database import Database
 from app.models import Notification, NotificationCreate, NotificationResponse, User
+from app.services.user import get_noc_user_ids
 from app.exceptions.http import (
     ConflictException,
     InternalServerErrorException,
@@ -13,26 +17,100 @@ from app.exceptions.http import (
 )
 
 
+# Base statements are immutable and built once; callers add filters generatively.
+_NOTIFICATION_STATEMENT = select(Notification).where(Notification.deleted_at.is_(None))  # type: ignore
+_NOTIFICATION_BY_ID_STATEMENT = _NOTIFICATION_STATEMENT.where(
+    Notification.id == bindparam("notification_id")
+)
+_UNREAD_COUNT_STATEMENT = select(func.count()).select_from(Notification).where(
+    Notification.deleted_at.is_(None),  # type: ignore
+    Notification.user_id == bindparam("user_id"),
+    Notification.read.is_(False),  # type: ignore
+)
+# Listings read plain column rows: no ORM instances or identity-map entries,
+# and deleted_at is implied by the filter.
+_NOTIFICATION_ROWS_STATEMENT = select(  # type: ignore
+    Notification.id,
+    Notification.created_at,
+    Notification.updated_at,
+    Notification.title,
+    Notification.message,
+    Notification.user_id,
+    Notification.priority,
+    Notification.read,
+).where(Notification.deleted_at.is_(None))  # type: ignore
+
+
+# Column limits from BaseNotification. The raw insert paths skip model
+# validation, so text is trimmed to fit here instead of failing the INSERT
+# (which would roll back the caller's session).
+_TITLE_MAX_LENGTH = 100
+_MESSAGE_MAX_LENGTH = 2000
+
+
+def _fit(text: str, max_length: int) -> str:
+    """Strip surrounding whitespace and truncate to the column length."""
+    text = text.strip()
+    if len(text) <= max_length:
+        return text
+    return text[: max_length - 3].rstrip() + "..."
+
+
 class _NotificationService:
     def notification_to_response(self, notification: Notification) -> NotificationResponse:
-        return NotificationResponse(
-            **notification.model_dump(),
-            )
+        # The row was validated on the way into the database, so build the
+        # response from its fields without a model_dump() round-trip.
+        return NotificationResponse.model_construct(
+            id=notification.id,
+            created_at=notification.created_at,
+            updated_at=notification.updated_at,
+            deleted_at=notification.deleted_at,
+            title=notification.title,
+            message=notification.message,
+            user_id=notification.user_id,
+            priority=notification.priority,
+            read=notification.read,
+        )
 
     def create_notification(self, data: NotificationCreate, session: Session) -> NotificationResponse:
-        # handle user
-        statement = select(User).where(User.id == data.user_id, User.deleted_at.is_(None)) # type: ignore
-        user: User | None = session.exec(statement).first()
-
-        if not user:
-            raise NotFoundException("user not found")
+        return self._create_notification_raw(data.user_id, data.title, data.message, data.priority, session)
 
-        notification: Notification = Notification(**data.model_dump(), user=user)
+    def _create_notification_raw(
+        self,
+        user_id: UUID,
+        title: str,
+        message: str,
+        priority: NotificationPriority,
+        session: Session
+    ) -> NotificationResponse:
+        """Insert one notification from already-trusted values, skipping NotificationCreate."""
+        now = utcnow()
+        values = {
+            "id": uuid4(),
+            "user_id": user_id,
+            "title": _fit(title, _TITLE_MAX_LENGTH),
+            "message": _fit(message, _MESSAGE_MAX_LENGTH),
+            "priority": priority,
+            "read": False,
+            "created_at": now,
+            "updated_at": now,
+        }
+        # INSERT ... SELECT from the live user row: the existence check and the
+        # insert are one round-trip, and no row is written for a missing user.
+        columns = Notification.__table__.c  # type: ignore[attr-defined]
+        source = select(
+            *(literal(value, type_=columns[name].type).label(name) for name, value in values.items())
+        ).where(User.id == user_id, User.deleted_at.is_(None))  # type: ignore
         try:
-            session.add(notification)
+            inserted = session.execute(
+                insert(Notification).from_select(list(values), source).returning(Notification.id)
+            ).first()
+            if inserted is None:
+                session.rollback()
+                raise NotFoundException("user not found")
             session.commit()
-            session.refresh(notification)
-            return self.notification_to_response(notification)
+        except NotFoundException:
+            raise
         except IntegrityError as e:
             session.rollback()
             raise ConflictException(f"Error creating notification: {e.orig}")
@@ -40,6 +118,9 @@ class _NotificationService:
             session.rollback()
             raise InternalServerErrorException(f"Unexpected error creating notification: {e}")
 
+        # Every column was set here, so the response needs no re-select
+        return NotificationResponse.model_construct(**values, deleted_at=None)
+
     def create_notification_for_user(
         self,
         user_id: UUID,
@@ -50,17 +131,90 @@ class _NotificationService:
     ) -> NotificationResponse | None:
         """Helper to create notification without raising exception if user not found."""
         try:
-            notification_data = NotificationCreate(
-                user_id=user_id,
-                title=title,
-                message=message,
-                priority=priority
-            )
-            return self.create_notification(notification_data, session)
+            return self._create_notification_raw(user_id, title, message, priority, session)
         except Exception:
             # Silently fail if notification creation fails
             return None
 
+    def create_notifications_for_users(
+        self,
+        user_ids: Iterable[UUID],
+        title: str,
+        message: str,
+        priority: NotificationPriority = NotificationPriority.NORMAL,
+        session: Session = None
+    ) -> int:
+        """Create the same notification for many users with one multi-row INSERT.
+
+        Like `create_notification_for_user` this never raises and skips unknown
+        or deleted users; it returns the number of notifications created (0 on
+        failure).
+        """
+        try:
+            # Validate every recipient with one IN-query instead of a SELECT per user
+            ids = list(set(user_ids))
+            valid_ids = session.exec(
+                select(User.id).where(User.id.in_(ids), User.deleted_at.is_(None))  # type: ignore
+            ).all() if ids else []
+            count = self.add_notifications_for_users(valid_ids, title, message, priority, session)
+            session.commit()
+            return count
+        except Exception:
+            # Silently fail if notification creation fails
+            session.rollback()
+            return 0
+
+    def notify_users(
+        self, user_ids: Sequence[UUID], title: str, message: str, priority: NotificationPriority
+    ) -> None:
+        """Create notifications in a dedicated session. Meant to run as a background task."""
+        with Database.session() as session:
+            self.create_notifications_for_users(
+                user_ids=user_ids,
+                title=title,
+                message=message,
+                priority=priority,
+                session=session
+            )
+
+    def notify_noc(self, title: str, message: str, priority: NotificationPriority) -> None:
+        """Notify all active NOC operators. Meant to run as a background task."""
+        with Database.session() as session:
+            noc_user_ids = get_noc_user_ids(session)
+        self.notify_users(noc_user_ids, title, message, priority)
+
+    def add_notifications_for_users(
+        self,
+        user_ids: Sequence[UUID],
+        title: str,
+        message: str,
+        priority: NotificationPriority,
+        session: Session
+    ) -> int:
+        """Insert notifications for many users into the caller's transaction without committing."""
+        if not user_ids:
+            return 0
+
+        now = utcnow()
+        title = _fit(title, _TITLE_MAX_LENGTH)
+        message = _fit(message, _MESSAGE_MAX_LENGTH)
+        # dict.fromkeys drops repeated recipients while keeping their order
+        rows = [
+            {
+                "id": uuid4(),
+                "user_id": user_id,
+                "title": title,
+                "message": message,
+                "priority": priority,
+                "read": False,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for user_id in dict.fromkeys(user_ids)
+        ]
+        session.execute(insert(Notification), rows)
+        return len(rows)
+
     def read_notification(self, notification_id: UUID, session: Session) -> NotificationResponse:
         notification = self._get_notification(notification_id, session)
         return self.notification_to_response(notification)
@@ -73,39 +227,91 @@ class _NotificationService:
         offset: int = 0,
         limit: int = 100,
     ) -> List[NotificationResponse]:
-        statement = select(Notification).where(Notification.deleted_at.is_(None))  # type: ignore
+        statement = _NOTIFICATION_ROWS_STATEMENT
 
         if priority is not None:
             statement = statement.where(Notification.priority == priority)
         if user_id is not None:
             statement = statement.where(Notification.user_id == user_id)
 
-        statement = statement.order_by(Notification.created_at.desc()).offset(offset).limit(limit)
-        notifications = session.exec(statement).all()
-        return [self.notification_to_response(notification) for notification in notifications]
+        # Stream rows through a server-side cursor instead of materialising them all first
+        statement = (
+            statement.order_by(Notification.created_at.desc())  # type: ignore
+            .offset(offset)
+            .limit(limit)
+            .execution_options(yield_per=200)
+        )
+        construct = NotificationResponse.model_construct
+        return [
+            construct(**row, deleted_at=None)
+            for row in session.execute(statement).mappings()
+        ]
+
+    def get_unread_count(self, user_id: UUID, session: Session) -> int:
+        """Count a user's unread notifications in SQL without loading the rows."""
+        return session.exec(_UNREAD_COUNT_STATEMENT, params={"user_id": user_id}).one()
+
+    def mark_all_as_read(self, user_id: UUID, session: Session) -> int:
+        """Mark every unread notification of a user as read with one UPDATE."""
+        statement = (
+            update(Notification)
+            .where(
+                Notification.deleted_at.is_(None),  # type: ignore
+                Notification.user_id == user_id,
+                Notification.read.is_(False),  # type: ignore
+            )
+            .values(read=True, updated_at=utcnow())
+            # Nothing loaded in this session needs reconciling with the UPDATE
+            .execution_options(synchronize_session=False)
+        )
+        try:
+            result = session.execute(statement)
+            session.commit()
+            return result.rowcount
+        except Exception as e:
+            session.rollback()
+            raise InternalServerErrorException(f"unexpected error reading notifications: {e}")
 
     def delete_notification(self, notification_id: UUID, session: Session) -> None:
-        notification = self._get_notification(notification_id, session)
-        notification.soft_delete()
+        # Soft delete by primary key without loading the row first
+        result = session.execute(
+            update(Notification)
+            .where(Notification.id == notification_id, Notification.deleted_at.is_(None))  # type: ignore
+            .values(deleted_at=utcnow())
+            .execution_options(synchronize_session=False)
+        )
+        if not result.rowcount:
+            session.rollback()
+            raise NotFoundException("notification not found")
         session.commit()
     
     def read(self, notification_id: UUID, session: Session) -> NotificationResponse:
         """Mark notification as read."""
-        notification = self._get_notification(notification_id, session)
-        notification.read = True
-        notification.touch()
         try:
+            # One UPDATE ... RETURNING instead of SELECT, UPDATE and refresh
+            notification = session.execute(
+                update(Notification)
+                .where(Notification.id == notification_id, Notification.deleted_at.is_(None))  # type: ignore
+                .values(read=True, updated_at=utcnow())
+                .returning(Notification)
+            ).scalars().first()
+            if not notification:
+                session.rollback()
+                raise NotFoundException("notification not found")
+            response = self.notification_to_response(notification)
             session.commit()
-            session.refresh(notification)
-            return self.notification_to_response(notification)
+            return response
+        except NotFoundException:
+            raise
         except Exception as e:
             session.rollback()
             raise InternalServerErrorException(f"unexpected error reading notification: {e}")
 
 
     def _get_notification(self, notification_id: UUID, session: Session) -> Notification:
-        statement = select(Notification).where(Notification.id == notification_id, Notification.deleted_at.is_(None))  # type: ignore
-        notification: Notification | None = session.exec(statement).first()
+        notification: Notification | None = session.exec(
+            _NOTIFICATION_BY_ID_STATEMENT, params={"notification_id": notification_id}
+        ).first()
         if not notification:
             raise NotFoundException("notification not found")
         return notification
@@ -1,96 +1,313 @@
+import reprlib
 from io import BytesIO
+from functools import lru_cache
 from datetime import datetime
 from typing import Any
 from pathlib import Path
 
+from PIL import Image as PILImage
+from reportlab import rl_config
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle, StyleSheet1
 from reportlab.lib.units import inch, mm
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, Image, PageBreak
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Table, TableStyle, PageBreak, Flowable
 from reportlab.lib.enums import TA_CENTER, TA_LEFT
 from reportlab.pdfgen import canvas
 from reportlab.lib.utils import ImageReader
+from reportlab.pdfbase import pdfmetrics
 
 from app.models import Report
 from app.utils.enums import ReportType
 
 
+# Write compressed streams as raw binary rather than ASCII85 text, which is ~25% larger
+rl_config.useA85 = 0
+
+# Load the metrics of the two fonts every report uses now, not on the first build
+for _font_name in ("Helvetica", "Helvetica-Bold"):
+    pdfmetrics.getFont(_font_name)
+
+
+_LABEL_TRANS = str.maketrans("-_", "  ")
+
+
+@lru_cache(maxsize=64)
+def _label(value: str) -> str:
+    """Turn an enum value such as 'routine-maintenance' into 'Routine Maintenance'."""
+    return value.translate(_LABEL_TRANS).strip().title()
+
+
+@lru_cache(maxsize=2048)
+def _humanize(key: str) -> str:
+    """Turn a report data key such as 'cable_length' into 'Cable Length'."""
+    return key.replace("_", " ").title()
+
+
+# Palette shared by the styles and tables below; HexColor parses each once
+_NAVY = colors.HexColor('#1a365d')
+_BRAND_NAVY = colors.HexColor('#0b2265')
+_WHITE = colors.HexColor('#ffffff')
+_LABEL_BG = colors.HexColor('#f0f4f8')
+_STRIPE_BG = colors.HexColor('#f7fafc')
+_GRID = colors.HexColor('#cbd5e0')
+_TEXT_DARK = colors.HexColor('#2d3748')
+_TEXT_MUTED = colors.HexColor('#4a5568')
+_TEXT_FAINT = colors.HexColor('#718096')
+
+_METADATA_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (0, -1), _LABEL_BG),
+    ('BACKGROUND', (0, 0), (-1, 0), _NAVY),
+    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+    ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('TEXTCOLOR', (0, 0), (0, -1), _TEXT_DARK),
+    ('TEXTCOLOR', (1, 0), (1, -1), _TEXT_MUTED),
+    ('TEXTCOLOR', (0, 0), (-1, 0), _WHITE),
+    ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
+    ('ALIGN', (1, 0), (1, -1), 'LEFT'),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('LEFTPADDING', (0, 0), (-1, -1), 10),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 10),
+    ('TOPPADDING', (0, 0), (-1, -1), 8),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+    ('GRID', (0, 0), (-1, -1), 1, _GRID),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [_WHITE, _STRIPE_BG]),
+])
+
+_ATTACHMENT_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), _NAVY),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTNAME', (0, 1), (0, -1), 'Helvetica-Bold'),
+    ('FONTNAME', (1, 1), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('TEXTCOLOR', (0, 0), (-1, 0), _WHITE),
+    ('TEXTCOLOR', (1, 1), (-1, -1), _TEXT_MUTED),
+    ('LEFTPADDING', (0, 0), (-1, -1), 10),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 10),
+    ('TOPPADDING', (0, 0), (-1, -1), 6),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+    ('GRID', (0, 0), (-1, -1), 1, _GRID),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [_WHITE, _STRIPE_BG]),
+])
+
+# Borderless label/value rows for runs of plain report data fields. The font
+# commands style plain-string cells the same way the FieldValue paragraphs look.
+_FIELDS_TABLE_STYLE = TableStyle([
+    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+    ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('LEADING', (0, 0), (-1, -1), 12),
+    ('TEXTCOLOR', (0, 0), (-1, -1), _TEXT_DARK),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('LEFTPADDING', (0, 0), (-1, -1), 0),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 6),
+    ('TOPPADDING', (0, 0), (-1, -1), 0),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+])
+
+
+# Indentation prefixes for the nesting levels report data realistically reaches
+_INDENTS = tuple("    " * level for level in range(8))
+
+
+def _indent(level: int) -> str:
+    return _INDENTS[level] if level < len(_INDENTS) else "    " * level
+
+
+# Attachment values are cut to this many characters in the attachments table
+_ATTACHMENT_VALUE_LIMIT = 60
+# Bounded repr for nested attachment values. Strings are allowed twice the cell
+# width because reprlib elides from the middle, keeping the visible prefix intact.
+_ATTACHMENT_REPR = reprlib.Repr()
+_ATTACHMENT_REPR.maxstring = 2 * _ATTACHMENT_VALUE_LIMIT
+_ATTACHMENT_REPR.maxother = 2 * _ATTACHMENT_VALUE_LIMIT
+
+
+def _truncate(value: Any) -> str:
+    """Shorten an attachment value for display without formatting all of a large nested value."""
+    if isinstance(value, str):
+        return value[:_ATTACHMENT_VALUE_LIMIT]
+    if isinstance(value, (dict, list)):
+        return _ATTACHMENT_REPR.repr(value)[:_ATTACHMENT_VALUE_LIMIT]
+    return str(value)[:_ATTACHMENT_VALUE_LIMIT]
+
+
+# Fields table column widths, and the text width each leaves after its 6pt right padding
+_FIELD_COL_WIDTHS = [140, 330]
+_LABEL_TEXT_WIDTH = _FIELD_COL_WIDTHS[0] - 6
+_VALUE_TEXT_WIDTH = _FIELD_COL_WIDTHS[1] - 6
+# Markup characters need the XML parser; newlines need Paragraph line handling
+_PARAGRAPH_CHARS = frozenset("<>&\n")
+
+
+def _field_cell(text: str, style: ParagraphStyle, label: bool = False) -> str | Paragraph:
+    """
+    Use a plain-string cell, which skips Paragraph's XML parse, when the text
+    fits its column on one line; string cells never wrap, so anything wider
+    (or containing markup characters) stays a wrapping Paragraph.
+    """
+    font_name, width = ('Helvetica-Bold', _LABEL_TEXT_WIDTH) if label else ('Helvetica', _VALUE_TEXT_WIDTH)
+    if _PARAGRAPH_CHARS.isdisjoint(text) and pdfmetrics.stringWidth(text, font_name, style.fontSize) <= width:
+        return text
+    return Paragraph(f"<b>{text}</b>" if label else text, style)
+
+
+_ASSETS_PATH = Path(__file__).parent.parent / "assets"
+
+
+def _build_styles() -> StyleSheet1:
+    """Build the sample stylesheet plus the custom paragraph styles for professional PDF design."""
+    styles = getSampleStyleSheet()
+    
+    # Header style with centered alignment
+    styles.add(ParagraphStyle(
+        name='CompanyHeader',
+        parent=styles['Normal'],
+        fontSize=24,
+        textColor=_BRAND_NAVY,
+        spaceAfter=4,
+        alignment=TA_CENTER,
+        fontName='Helvetica-Bold'
+    ))
+    
+    # Report title with centered alignment
+    styles.add(ParagraphStyle(
+        name='ReportTitle',
+        parent=styles['Heading1'],
+        fontSize=18,
+        spaceAfter=8,
+        alignment=TA_CENTER,
+        textColor=_NAVY,
+        fontName='Helvetica-Bold',
+        spaceBefore=22
+    ))
+    
+    # Section header with centered alignment and rounded effect via styling
+    styles.add(ParagraphStyle(
+        name='SectionHeader',
+        parent=styles['Heading2'],
+        fontSize=12,
+        spaceBefore=14,
+        spaceAfter=10,
+        textColor=_WHITE,
+        fontName='Helvetica-Bold',
+        alignment=TA_CENTER,
+        backColor=_NAVY
+    ))
+    
+    # Field label
+    styles.add(ParagraphStyle(
+        name='FieldLabel',
+        parent=styles['Normal'],
+        fontSize=9,
+        textColor=_TEXT_MUTED,
+        spaceAfter=2,
+        fontName='Helvetica-Bold'
+    ))
+    
+    # Field value
+    styles.add(ParagraphStyle(
+        name='FieldValue',
+        parent=styles['Normal'],
+        fontSize=10,
+        spaceAfter=6,
+        textColor=_TEXT_DARK,
+        fontName='Helvetica'
+    ))
+    
+    # Footer style
+    styles.add(ParagraphStyle(
+        name='Footer',
+        parent=styles['Normal'],
+        fontSize=8,
+        textColor=_TEXT_FAINT,
+        alignment=TA_CENTER,
+        spaceBefore=28
+    ))
+    
+    return styles
+
+
+# Logos are drawn in a 70mm x 25mm box; keep no more pixels than 300 DPI print needs
+_LOGO_PIXELS = (round(70 / 25.4 * 300), round(25 / 25.4 * 300))
+
+
+def _load_logo(filename: str) -> ImageReader | None:
+    """Decode a logo asset once, downsized to its print size, or None when it is missing or unreadable."""
+    try:
+        path = _ASSETS_PATH / filename
+        if path.exists():
+            with PILImage.open(path) as logo:
+                if logo.width > _LOGO_PIXELS[0] or logo.height > _LOGO_PIXELS[1]:
+                    logo = logo.resize(_LOGO_PIXELS, PILImage.LANCZOS)
+                data = BytesIO()
+                # Alpha is kept so the logos stay transparent on the page
+                logo.save(data, format="PNG", optimize=True)
+            data.seek(0)
+            return ImageReader(data)
+    except Exception:
+        pass
+    return None
+
+
+# Stylesheet and logos are identical for every report; build them once per process
+_STYLES = _build_styles()
+_SAMO_LOGO = _load_logo("samo-logo.png")
+_SEACOM_LOGO = _load_logo("seacom-logo.png")
+
+
+class _LogoBar(Flowable):
+    """Company logos side by side, drawn straight onto the canvas without a Table layout pass."""
+    
+    # Two 70mm logo cells either side of a 50mm gap, centred on the frame
+    _CELL_WIDTH = 70*mm
+    _GAP = 50*mm
+    _HEIGHT = 25*mm
+    
+    def wrap(self, availWidth, availHeight):
+        self._avail_width = availWidth
+        return availWidth, self._HEIGHT
+    
+    def draw(self):
+        x = (self._avail_width - 2 * self._CELL_WIDTH - self._GAP) / 2
+        self._draw_logo(_SAMO_LOGO, "SAMO TELECOMS", x)
+        self._draw_logo(_SEACOM_LOGO, "SEACOM", x + self._CELL_WIDTH + self._GAP)
+    
+    def _draw_logo(self, logo: ImageReader | None, fallback: str, x: float):
+        if logo:
+            self.canv.drawImage(logo, x, 0, self._CELL_WIDTH, self._HEIGHT, mask='auto')
+            return
+        # Text fallback in the CompanyHeader look, centred in its cell
+        self.canv.setFont('Helvetica-Bold', 24)
+        self.canv.setFillColor(_BRAND_NAVY)
+        self.canv.drawCentredString(x + self._CELL_WIDTH / 2, (self._HEIGHT - 17) / 2, fallback)
+
+
+class _Divider(Flowable):
+    """Navy rule drawn straight onto the canvas, in place of a one-cell bordered Table."""
+    
+    _WIDTH = 470
+    # Height of the empty 10pt table row the rule used to sit under
+    _HEIGHT = 12
+    
+    def wrap(self, availWidth, availHeight):
+        self._avail_width = availWidth
+        return availWidth, self._HEIGHT
+    
+    def draw(self):
+        x = (self._avail_width - self._WIDTH) / 2
+        self.canv.setStrokeColor(_NAVY)
+        self.canv.setLineWidth(2)
+        self.canv.line(x, 0, x + self._WIDTH, 0)
+
+
 class PDFService:
     """Service for generating PDF documents from reports."""
     
     def __init__(self):
-        self.styles = getSampleStyleSheet()
-        self._setup_custom_styles()
-        self.assets_path = Path(__file__).parent.parent / "assets"
-    
-    def _setup_custom_styles(self):
-        """Setup custom paragraph styles for professional PDF design."""
-        # Header style with centered alignment
-        self.styles.add(ParagraphStyle(
-            name='CompanyHeader',
-            parent=self.styles['Normal'],
-            fontSize=24,
-            textColor=colors.HexColor('#0b2265'),
-            spaceAfter=4,
-            alignment=TA_CENTER,
-            fontName='Helvetica-Bold'
-        ))
-        
-        # Report title with centered alignment
-        self.styles.add(ParagraphStyle(
-            name='ReportTitle',
-            parent=self.styles['Heading1'],
-            fontSize=18,
-            spaceAfter=8,
-            alignment=TA_CENTER,
-            textColor=colors.HexColor('#1a365d'),
-            fontName='Helvetica-Bold',
-            spaceBefore=12
-        ))
-        
-        # Section header with centered alignment and rounded effect via styling
-        self.styles.add(ParagraphStyle(
-            name='SectionHeader',
-            parent=self.styles['Heading2'],
-            fontSize=12,
-            spaceBefore=14,
-            spaceAfter=10,
-            textColor=colors.HexColor('#ffffff'),
-            fontName='Helvetica-Bold',
-            alignment=TA_CENTER,
-            backColor=colors.HexColor('#1a365d')
-        ))
-        
-        # Field label
-        self.styles.add(ParagraphStyle(
-            name='FieldLabel',
-            parent=self.styles['Normal'],
-            fontSize=9,
-            textColor=colors.HexColor('#4a5568'),
-            spaceAfter=2,
-            fontName='Helvetica-Bold'
-        ))
-        
-        # Field value
-        self.styles.add(ParagraphStyle(
-            name='FieldValue',
-            parent=self.styles['Normal'],
-            fontSize=10,
-            spaceAfter=6,
-            textColor=colors.HexColor('#2d3748'),
-            fontName='Helvetica'
-        ))
-        
-        # Footer style
-        self.styles.add(ParagraphStyle(
-            name='Footer',
-            parent=self.styles['Normal'],
-            fontSize=8,
-            textColor=colors.HexColor('#718096'),
-            alignment=TA_CENTER,
-            spaceBefore=20
-        ))
+        self.styles = _STYLES
+        self.assets_path = _ASSETS_PATH
     
     def generate_report_pdf(self, report: Report) -> BytesIO:
         """
@@ -105,6 +322,9 @@ class PDFService:
         buffer = BytesIO()
         
         try:
+            report_id = str(report.id)
+            report_type = report.report_type
+            
             doc = SimpleDocTemplate(
                 buffer,
                 pagesize=A4,
@@ -112,63 +332,27 @@ class PDFService:
                 leftMargin=20*mm,
                 topMargin=20*mm,
                 bottomMargin=20*mm,
-                title=f"Report_{report.report_type.value}_{report.id}"
+                pageCompression=1,
+                title=f"Report_{report_type.value}_{report_id}"
             )
             
             story = []
             
-            # Create header with company logos
-            # Load PNG logos if available
-            samo_logo = None
-            seacom_logo = None
-            
-            try:
-                samo_png_path = self.assets_path / "samo-logo.png"
-                if samo_png_path.exists():
-                    samo_logo = Image(str(samo_png_path), width=70*mm, height=25*mm)
-            except Exception:
-                pass
-            
-            try:
-                seacom_png_path = self.assets_path / "seacom-logo.png"
-                if seacom_png_path.exists():
-                    seacom_logo = Image(str(seacom_png_path), width=70*mm, height=25*mm)
-            except Exception:
-                pass
-            
-            # Build logo row - use images if available, otherwise text
-            logo_row = [
-                samo_logo if samo_logo else Paragraph("<b>SAMO TELECOMS</b>", self.styles['CompanyHeader']),
-                Spacer(1, 0),  # Center spacer
-                seacom_logo if seacom_logo else Paragraph("<b>SEACOM</b>", self.styles['CompanyHeader'])
-            ]
-            
-            logo_table = Table([logo_row], colWidths=[70*mm, 50*mm, 70*mm])
-            logo_table.setStyle(TableStyle([
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                ('LEFTPADDING', (0, 0), (-1, -1), 0),
-                ('RIGHTPADDING', (0, 0), (-1, -1), 0),
-                ('TOPPADDING', (0, 0), (-1, -1), 0),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
-            ]))
-            story.append(logo_table)
-            story.append(Spacer(1, 10))
+            # Create header with company logos - images if available, otherwise text
+            story.append(_LogoBar())
             
             # Divider line
-            story.append(self._create_divider())
-            story.append(Spacer(1, 10))
+            story.append(self._create_divider(space_before=10))
             
             # Report Title - centered
-            report_type_display = self._format_report_type(report.report_type)
+            report_type_display = self._format_report_type(report_type)
             story.append(Paragraph(f"{report_type_display} Report", self.styles['ReportTitle']))
-            story.append(Spacer(1, 14))
             
             # Report Metadata Section
-            story.append(Paragraph("Report Information", self.styles['SectionHeader']))
+            story.append(self._section_header("Report Information", space_before=36))
             
             metadata_data = [
-                ["Report ID", str(report.id)],
+                ["Report ID", report_id],
                 ["Report Type", report_type_display],
                 ["Status", report.status.value.upper()],
                 ["Service Provider", report.service_provider],
@@ -178,89 +362,54 @@ class PDFService:
             
             # Add technician info - with safety checks
             try:
-                if report.technician and report.technician.user:
-                    user = report.technician.user
+                technician = report.technician
+                user = technician.user if technician else None
+                if user:
                     metadata_data.append(["Technician", f"{user.name} {user.surname}"])
-                    metadata_data.append(["Phone", report.technician.phone])
+                    metadata_data.append(["Phone", technician.phone])
             except Exception:
                 pass
             
             # Add task info - with safety checks
             try:
-                if report.task:
-                    if report.task.seacom_ref:
-                        metadata_data.append(["Task Reference", report.task.seacom_ref])
-                    if report.task.site:
-                        metadata_data.append(["Site", report.task.site.name])
-                        metadata_data.append(["Region", report.task.site.region.value.replace("-", " ").title()])
+                task = report.task
+                if task:
+                    if task.seacom_ref:
+                        metadata_data.append(["Task Reference", task.seacom_ref])
+                    site = task.site
+                    if site:
+                        metadata_data.append(["Site", site.name])
+                        metadata_data.append(["Region", _label(site.region.value)])
             except Exception:
                 pass
             
             # Create metadata table with rounded corners effect
-            metadata_table = Table(metadata_data, colWidths=[110, 360])
-            metadata_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#f0f4f8')),
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1a365d')),
-                ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-                ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
-                ('FONTSIZE', (0, 0), (-1, -1), 9),
-                ('TEXTCOLOR', (0, 0), (0, -1), colors.HexColor('#2d3748')),
-                ('TEXTCOLOR', (1, 0), (1, -1), colors.HexColor('#4a5568')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.HexColor('#ffffff')),
-                ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
-                ('ALIGN', (1, 0), (1, -1), 'LEFT'),
-                ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-                ('LEFTPADDING', (0, 0), (-1, -1), 10),
-                ('RIGHTPADDING', (0, 0), (-1, -1), 10),
-                ('TOPPADDING', (0, 0), (-1, -1), 8),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-                ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#cbd5e0')),
-                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.HexColor('#ffffff'), colors.HexColor('#f7fafc')]),
-            ]))
+            metadata_table = Table(metadata_data, colWidths=[110, 360], spaceAfter=16)
+            metadata_table.setStyle(_METADATA_TABLE_STYLE)
             story.append(metadata_table)
-            story.append(Spacer(1, 16))
             
             # Report Data Section
             if report.data:
-                story.append(Paragraph("Report Details", self.styles['SectionHeader']))
-                story.append(Spacer(1, 10))
+                story.append(self._section_header("Report Details", space_before=30, space_after=20))
                 story.extend(self._render_report_data(report.data))
             
-            # Attachments Section
+            # Attachments Section (an empty dict is falsy, so no header-only table)
             if report.attachments:
-                story.append(Spacer(1, 16))
-                story.append(Paragraph("Attachments", self.styles['SectionHeader']))
+                story.append(self._section_header("Attachments", space_before=30))
                 
-                attachment_data = [["Field Name", "Value"]]
-                for key, value in report.attachments.items():
-                    attachment_data.append([key, str(value)[:60]])
-                
-                if len(attachment_data) > 1:
-                    att_table = Table(attachment_data, colWidths=[140, 330])
-                    att_table.setStyle(TableStyle([
-                        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1a365d')),
-                        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                        ('FONTNAME', (0, 1), (0, -1), 'Helvetica-Bold'),
-                        ('FONTNAME', (1, 1), (-1, -1), 'Helvetica'),
-                        ('FONTSIZE', (0, 0), (-1, -1), 9),
-                        ('TEXTCOLOR', (0, 0), (-1, 0), colors.HexColor('#ffffff')),
-                        ('TEXTCOLOR', (1, 1), (-1, -1), colors.HexColor('#4a5568')),
-                        ('LEFTPADDING', (0, 0), (-1, -1), 10),
-                        ('RIGHTPADDING', (0, 0), (-1, -1), 10),
-                        ('TOPPADDING', (0, 0), (-1, -1), 6),
-                        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-                        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#cbd5e0')),
-                        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.HexColor('#ffffff'), colors.HexColor('#f7fafc')]),
-                    ]))
-                    story.append(att_table)
+                attachment_data = [
+                    ["Field Name", "Value"],
+                    *([key, _truncate(value)] for key, value in report.attachments.items()),
+                ]
+                att_table = Table(attachment_data, colWidths=[140, 330])
+                att_table.setStyle(_ATTACHMENT_TABLE_STYLE)
+                story.append(att_table)
             
             # Footer
-            story.append(Spacer(1, 24))
-            story.append(self._create_divider())
-            story.append(Spacer(1, 8))
+            story.append(self._create_divider(space_before=24))
             story.append(Paragraph(
                 f"Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} UTC | "
-                f"Report ID: {str(report.id)[:8]}",
+                f"Report ID: {report_id[:8]}",
                 self.styles['Footer']
             ))
             
@@ -273,21 +422,38 @@ class PDFService:
         buffer.seek(0)
         return buffer
     
-    def _create_divider(self):
-        """Create a divider line as a table."""
-        divider = Table([[""],], colWidths=[470])
-        divider.setStyle(TableStyle([
-            ('LINEBELOW', (0, 0), (-1, 0), 2, colors.HexColor('#1a365d')),
-            ('LEFTPADDING', (0, 0), (-1, -1), 0),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 0),
-            ('TOPPADDING', (0, 0), (-1, -1), 0),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
-        ]))
+    def generate_report_bytes(self, report: Report) -> bytes:
+        """
+        Generate the report PDF and return its bytes.
+        
+        For callers that only send the document; the build buffer is dropped
+        as soon as its contents are taken instead of being handed around.
+        """
+        return self.generate_report_pdf(report).getvalue()
+    
+    def _create_divider(self, space_before: float = 0):
+        """Create a divider line."""
+        divider = _Divider()
+        divider.spaceBefore = space_before
         return divider
     
+    def _section_header(self, title: str, space_before: float, space_after: float | None = None) -> Paragraph:
+        """
+        Create a section header that carries its own spacing.
+        
+        Platypus collapses adjacent gaps to the larger of spaceAfter and
+        spaceBefore, so each value here already includes the space the
+        surrounding elements used to add.
+        """
+        header = Paragraph(title, self.styles['SectionHeader'])
+        header.spaceBefore = space_before
+        if space_after is not None:
+            header.spaceAfter = space_after
+        return header
+    
     def _format_report_type(self, report_type: ReportType) -> str:
         """Format report type enum to display string."""
-        return report_type.value.replace("-", " ").title()
+        return _label(report_type.value)
     
     def _format_datetime(self, dt: datetime | None) -> str:
         """Format datetime to display string."""
@@ -295,61 +461,77 @@ class PDFService:
             return "N/A"
         return dt.strftime("%Y-%m-%d %H:%M:%S")
     
-    def _render_report_data(self, data: dict[str, Any], level: int = 0) -> list:
+    def _render_report_data(self, data: dict[str, Any]) -> list:
         """
-        Recursively render report data dictionary into PDF elements.
+        Render report data dictionary into PDF elements.
+        
+        Nested dicts and lists are walked with an explicit stack, so every
+        element goes straight into one output list at any depth. Runs of
+        plain fields become one label/value table rather than a flowable each.
         
         Args:
             data: The data dictionary to render
-            level: Nesting level for indentation
             
         Returns:
             List of PDF elements
         """
         elements = []
-        indent = "    " * level
+        style = self.styles['FieldValue']
+        # Consecutive plain fields are collected here and laid out as one table
+        rows = []
+        # Frames are (level, key, value, item_number); item_number is None for
+        # dict fields. Children are pushed in reverse so they pop in order.
+        stack = [(0, key, value, None) for key, value in reversed(data.items())]
         
-        for key, value in data.items():
-            formatted_key = key.replace("_", " ").title()
+        while stack:
+            level, key, value, item_number = stack.pop()
+            indent = _indent(level)
             
+            if item_number is None and not isinstance(value, (dict, list)):
+                formatted_key = _humanize(key)
+                if isinstance(value, bool):
+                    display_value = "Yes" if value else "No"
+                else:
+                    display_value = str(value) if value is not None else "N/A"
+                rows.append([
+                    _field_cell(f"{formatted_key}:", style, label=True),
+                    _field_cell(display_value, style),
+                ])
+                continue
+            
+            if rows:
+                elements.append(self._fields_table(rows))
+                rows = []
+            
+            if item_number is not None:
+                if isinstance(value, dict):
+                    elements.append(Paragraph(f"{indent}    Item {item_number}:", style))
+                    stack.extend((level + 2, k, v, None) for k, v in reversed(value.items()))
+                else:
+                    elements.append(Paragraph(f"{indent}    • {value}", style))
+                continue
+            
+            formatted_key = _humanize(key)
+            elements.append(Paragraph(f"{indent}<b>{formatted_key}:</b>", style))
             if isinstance(value, dict):
-                elements.append(Paragraph(
-                    f"{indent}<b>{formatted_key}:</b>",
-                    self.styles['FieldValue']
-                ))
-                elements.extend(self._render_report_data(value, level + 1))
-            elif isinstance(value, list):
-                elements.append(Paragraph(
-                    f"{indent}<b>{formatted_key}:</b>",
-                    self.styles['FieldValue']
-                ))
-                for i, item in enumerate(value):
-                    if isinstance(item, dict):
-                        elements.append(Paragraph(
-                            f"{indent}    Item {i + 1}:",
-                            self.styles['FieldValue']
-                        ))
-                        elements.extend(self._render_report_data(item, level + 2))
-                    else:
-                        elements.append(Paragraph(
-                            f"{indent}    • {item}",
-                            self.styles['FieldValue']
-                        ))
-            elif isinstance(value, bool):
-                display_value = "Yes" if value else "No"
-                elements.append(Paragraph(
-                    f"{indent}<b>{formatted_key}:</b> {display_value}",
-                    self.styles['FieldValue']
-                ))
+                stack.extend((level + 1, k, v, None) for k, v in reversed(value.items()))
             else:
-                display_value = str(value) if value is not None else "N/A"
-                elements.append(Paragraph(
-                    f"{indent}<b>{formatted_key}:</b> {display_value}",
-                    self.styles['FieldValue']
-                ))
+                stack.extend(
+                    (level, None, item, i) for i, item in reversed(list(enumerate(value, 1)))
+                )
+        
+        if rows:
+            elements.append(self._fields_table(rows))
         
         return elements
+    
+    def _fields_table(self, rows: list) -> Table:
+        """Lay out a run of plain label/value fields as a single table."""
+        table = Table(rows, colWidths=_FIELD_COL_WIDTHS, hAlign='LEFT')
+        table.setStyle(_FIELDS_TABLE_STYLE)
+        return table
 
 
+@lru_cache(maxsize=1)
 def get_pdf_service() -> PDFService:
     return PDFService()
@@ -21,7 +21,8 @@ from app.core.settings import app_settings
 # lazy import to keep redis optional
 _redis_client = None
 
-def _get_redis():
+def get_redis():
+    """Shared Redis client, or None when REDIS_URL is unset or Redis is unreachable."""
     global _redis_client
     if _redis_client:
         return _redis_client
@@ -53,7 +54,7 @@ class PresenceService:
     # -------------------- Redis-backed implementations --------------------
     @classmethod
     def _redis_upsert(cls, user_id, role: str, session_id: str, expires_at: Optional[datetime] = None) -> dict:
-        r = _get_redis()
+        r = get_redis()
         now_ts = int(time.time())
         meta = {
             "user_id": str(user_id),
@@ -76,7 +77,7 @@ class PresenceService:
 
     @classmethod
     def _redis_heartbeat(cls, user_id, role: str, session_id: Optional[str] = None) -> dict:
-        r = _get_redis()
+        r = get_redis()
         now_ts = int(time.time())
         # prefer session_id; try to find by user_id otherwise
         if session_id:
@@ -115,7 +116,7 @@ class PresenceService:
 
     @classmethod
     def _redis_deactivate(cls, user_id=None, session_id: Optional[str] = None) -> None:
-        r = _get_redis()
+        r = get_redis()
         if session_id:
             meta_key = cls._HASH_SESSION.format(session_id=session_id)
             meta_json = r.hget(meta_key, "meta")
@@ -143,7 +144,7 @@ class PresenceService:
 
     @classmethod
     def _redis_list_active_noc(cls, cutoff_minutes: int = 10) -> List[dict]:
-        r = _get_redis()
+        r = get_redis()
         cutoff_ts = int(time.time()) - (cutoff_minutes * 60)
         key = cls._ZKEY_ROLE.format(role=UserRole.NOC)
         members = r.zrangebyscore(key, cutoff_ts, "+inf")
@@ -274,7 +275,7 @@ class PresenceService:
                 results.append({
                     "user_id": str(user_row.id),
                     "fullname": f"{user_row.name} {user_row.surname}",
-                    "role": str(user_row.role),
+                    "role": user_row.role.value,
                     "session_id": session_row.session_id,
                     "is_active": bool(session_row.is_active),
                     "last_seen": last_seen_val.isoformat() if last_seen_val else None,
@@ -1,10 +1,8 @@
 from uuid import UUID
-from io import BytesIO
 from fastapi import Depends
 from typing import List, Annotated
 from sqlmodel import Session, select, text
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy import and_
 from sqlalchemy.orm import object_session
 
 from app.utils.enums import ReportType, ReportStatus, NotificationPriority
@@ -16,6 +14,10 @@ from app.exceptions.http import (
     ForbiddenException
 )
 from app.services.pdf import get_pdf_service
+from app.services.user import get_noc_user_ids
+from app.services.notification import _NotificationService
+
+_NOTIFICATION_SERVICE = _NotificationService()
 
 
 class _ReportService:
@@ -41,40 +43,27 @@ class _ReportService:
             session.commit()
             session.refresh(report)
             
-            # Get task and technician info for notification
-            task = session.exec(select(Task).where(Task.id == data.task_id)).first()
-            technician = session.exec(select(Technician).where(Technician.id == data.technician_id)).first()
+            # Get task and technician info for notification in a single round-trip
+            row = session.exec(
+                select(Task, Technician).where(Task.id == data.task_id, Technician.id == data.technician_id)
+            ).first()
             
-            if task and technician:
-                # Create notification for NOC operators about new report
-                from app.services.notification import _NotificationService
-                from app.models import User
-                from app.utils.enums import UserRole
-                
-                notification_service = _NotificationService()
-                
-                # Notify all NOC operators
-                noc_users = session.exec(
-                    select(User).where(
-                        and_(
-                            User.role == UserRole.NOC,
-                            User.deleted_at.is_(None)
-                        )
-                    )
-                ).all()
+            if row:
+                task, technician = row
+                # Notify all NOC operators about the new report
+                noc_user_ids = get_noc_user_ids(session)
                 
                 # Get site name safely
                 site_name = task.site.name if task.site else "Unknown Site"
                 technician_name = technician.user.name if technician.user else "Unknown Technician"
                 
-                for noc_user in noc_users:
-                    notification_service.create_notification_for_user(
-                        user_id=noc_user.id,
-                        title=f"New Report Submitted",
-                        message=f"{technician_name} submitted a {data.report_type} report for task at {site_name}",
-                        priority=NotificationPriority.NORMAL,
-                        session=session
-                    )
+                _NOTIFICATION_SERVICE.create_notifications_for_users(
+                    user_ids=noc_user_ids,
+                    title=f"New Report Submitted",
+                    message=f"{technician_name} submitted a {data.report_type} report for task at {site_name}",
+                    priority=NotificationPriority.NORMAL,
+                    session=session
+                )
             
             return self.report_to_response(report)
         except IntegrityError as e:
@@ -221,7 +210,7 @@ class _ReportService:
             session.rollback()
             raise InternalServerErrorException(f"Unexpected error completing report: {e}")
 
-    def export_report_pdf(self, report_id: UUID, session: Session) -> tuple[BytesIO, str]:
+    def export_report_pdf(self, report_id: UUID, session: Session) -> tuple[bytes, str]:
         """
         Export a completed report as a PDF document.
         
@@ -230,7 +219,7 @@ class _ReportService:
             session: Database session
             
         Returns:
-            Tuple of (PDF buffer, filename)
+            Tuple of (PDF bytes, filename)
             
         Raises:
             NotFoundException: If report not found
@@ -246,10 +235,9 @@ class _ReportService:
             session.refresh(report)
             
             pdf_service = get_pdf_service()
-            pdf_buffer = pdf_service.generate_report_pdf(report)
+            pdf_bytes = pdf_service.generate_report_bytes(report)
             
-            # Verify buffer has content
-            pdf_bytes = pdf_buffer.getvalue()
+            # Verify the document has content
             if not pdf_bytes:
                 raise InternalServerErrorException("Failed to generate PDF: empty buffer")
             
@@ -258,9 +246,7 @@ class _ReportService:
             created_date = report.created_at.strftime("%Y%m%d") if report.created_at else "unknown"
             filename = f"report_{report_type}_{created_date}_{str(report.id)[:8]}.pdf"
             
-            # Reset buffer for reading
-            pdf_buffer.seek(0)
-            return pdf_buffer, filename
+            return pdf_bytes, filename
         except ForbiddenException:
             raise
         except NotFoundException:
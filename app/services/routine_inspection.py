@@ -3,10 +3,16 @@ from typing import List, Any, Annotated
 from sqlmodel import Session, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy import and_
+from sqlalchemy.orm import joinedload, raiseload
 from fastapi import Depends
+from pydantic import TypeAdapter
 
+from app.core.settings import app_settings
 from app.utils.enums import NotificationPriority
-from app.models import RoutineInspection, RoutineInspectionCreate, RoutineInspectionUpdate, RoutineInspectionResponse, Task, Technician, Site
+from app.models import RoutineInspection, RoutineInspectionCreate, RoutineInspectionUpdate, RoutineInspectionResponse, Task, Technician, Site, User
+from app.services.user import get_noc_user_ids
+from app.services.notification import _NotificationService
+from app.services.presence import get_redis
 from app.exceptions.http import (
     ConflictException,
     InternalServerErrorException,
@@ -15,66 +21,100 @@ from app.exceptions.http import (
 )
 
 
+_NOTIFICATION_SERVICE = _NotificationService()
+
+# Relationships read by `inspection_to_response`, loaded up-front to avoid per-row lazy loads.
+# All of them are many-to-one, so they join into the main SELECT: a listing is one
+# query however many rows it returns, including across yield_per batches.
+_INSPECTION_LOADER_OPTIONS = (
+    joinedload(RoutineInspection.site),  # type: ignore
+    joinedload(RoutineInspection.technician).joinedload(Technician.user),  # type: ignore
+    joinedload(RoutineInspection.task),  # type: ignore
+)
+
+# Read-only paths also refuse any other lazy load when STRICT_ORM_LOADING is set.
+_READ_LOADER_OPTIONS = (
+    (*_INSPECTION_LOADER_OPTIONS, raiseload("*")) if app_settings.STRICT_ORM_LOADING else _INSPECTION_LOADER_OPTIONS
+)
+
+
+# Listing responses are cached in Redis (when configured) for a short TTL.
+# Writes bump a version counter rather than scanning for keys to delete.
+INSPECTION_LIST_CACHE_TTL_SECONDS: int = 30
+_INSPECTION_LIST_VERSION_KEY = "routine_inspections:list:version"
+_INSPECTION_LIST_ADAPTER = TypeAdapter(List[RoutineInspectionResponse])
+
+
+def _invalidate_inspection_list_cache() -> None:
+    """Orphan every cached listing; they expire on their own TTL."""
+    r = get_redis()
+    if r is None:
+        return
+    try:
+        r.incr(_INSPECTION_LIST_VERSION_KEY)
+    except Exception:
+        pass
+
+
 class _RoutineInspectionService:
     def inspection_to_response(self, inspection: RoutineInspection) -> RoutineInspectionResponse:
-        site = inspection.site if hasattr(inspection, 'site') else None
-        technician = inspection.technician if hasattr(inspection, 'technician') else None
-        task = inspection.task if hasattr(inspection, 'task') else None
-        
-        site_name = site.name if site else None
-        technician_fullname = f"{technician.user.name} {technician.user.surname}" if technician and technician.user else None
-        seacom_ref = task.seacom_ref if task else None
-        
-        return RoutineInspectionResponse(
-            **inspection.model_dump(),
-            site_name=site_name,
-            technician_fullname=technician_fullname,
-            seacom_ref=seacom_ref
+        site = inspection.site
+        technician = inspection.technician
+        task = inspection.task
+
+        # The row was validated on the way into the database, so build the
+        # response from the fields it needs without re-running validation.
+        return RoutineInspectionResponse.model_construct(
+            id=inspection.id,
+            created_at=inspection.created_at,
+            updated_at=inspection.updated_at,
+            deleted_at=inspection.deleted_at,
+            data=inspection.data,
+            attachments=inspection.attachments,
+            site_id=inspection.site_id,
+            task_id=inspection.task_id,
+            technician_id=inspection.technician_id,
+            status=inspection.status,
+            site_name=site.name if site else None,
+            technician_fullname=f"{technician.user.name} {technician.user.surname}" if technician and technician.user else None,
+            seacom_ref=task.seacom_ref if task else None,
         )
 
     def create_inspection(self, data: RoutineInspectionCreate, session: Session) -> RoutineInspectionResponse:
         inspection: RoutineInspection = RoutineInspection(**data.model_dump())
         try:
             session.add(inspection)
+            # Every column is set in Python, so build the response before
+            # commit() expires the instance instead of re-selecting the row.
+            session.flush()
+            response = self.inspection_to_response(inspection)
             session.commit()
-            session.refresh(inspection)
+            _invalidate_inspection_list_cache()
             
-            # Get task and technician info for notification
-            task = session.exec(select(Task).where(Task.id == data.task_id)).first()
-            technician = session.exec(select(Technician).where(Technician.id == data.technician_id)).first()
+            # Site and technician names for the notification, in one joined column select
+            names = session.exec(
+                select(Site.name, User.name)
+                .select_from(Task)
+                .join(Technician, Technician.id == data.technician_id)  # type: ignore
+                .outerjoin(Site, Site.id == Task.site_id)  # type: ignore
+                .outerjoin(User, User.id == Technician.user_id)  # type: ignore
+                .where(Task.id == data.task_id)
+            ).first()
             
-            if task and technician:
-                # Create notification for NOC operators about new inspection
-                from app.services.notification import _NotificationService
-                from app.models import User
-                from app.utils.enums import UserRole
+            if names:
+                site_name = names[0] or "Unknown Site"
+                technician_name = names[1] or "Unknown Technician"
                 
-                notification_service = _NotificationService()
-                
-                # Notify all NOC operators
-                noc_users = session.exec(
-                    select(User).where(
-                        and_(
-                            User.role == UserRole.NOC,
-                            User.deleted_at.is_(None)
-                        )
-                    )
-                ).all()
-                
-                # Get site name safely
-                site_name = task.site.name if task.site else "Unknown Site"
-                technician_name = technician.user.name if technician.user else "Unknown Technician"
-                
-                for noc_user in noc_users:
-                    notification_service.create_notification_for_user(
-                        user_id=noc_user.id,
-                        title="Generator Routine Inspection Started: " + site_name,
-                        message=f"Technician: {technician_name}\nSite: {site_name}",
-                        priority=NotificationPriority.NORMAL,
-                        session=session
-                    )
+                # Notify all NOC operators with one multi-row INSERT
+                _NOTIFICATION_SERVICE.create_notifications_for_users(
+                    get_noc_user_ids(session),
+                    title="Generator Routine Inspection Started: " + site_name,
+                    message=f"Technician: {technician_name}\nSite: {site_name}",
+                    priority=NotificationPriority.NORMAL,
+                    session=session
+                )
             
-            return self.inspection_to_response(inspection)
+            return response
         except IntegrityError as e:
             session.rollback()
             raise ConflictException(f"Error creating routine inspection: {e.orig}")
@@ -83,7 +123,7 @@ class _RoutineInspectionService:
             raise InternalServerErrorException(f"Unexpected error creating routine inspection: {e}")
 
     def read_inspection(self, inspection_id: UUID, session: Session) -> RoutineInspectionResponse:
-        inspection = self._get_inspection(inspection_id, session)
+        inspection = self._get_inspection(inspection_id, session, strict=True)
         return self.inspection_to_response(inspection)
 
     def read_inspections(
@@ -95,7 +135,23 @@ class _RoutineInspectionService:
         offset: int = 0,
         limit: int = 100,
     ) -> List[RoutineInspectionResponse]:
-        statement = select(RoutineInspection).where(RoutineInspection.deleted_at.is_(None))  # type: ignore
+        r = get_redis()
+        cache_key = None
+        if r is not None:
+            try:
+                version = r.get(_INSPECTION_LIST_VERSION_KEY) or "0"
+                cache_key = f"routine_inspections:v{version}:list:{status}:{technician_id}:{site_id}:{offset}:{limit}"
+                cached = r.get(cache_key)
+                if cached:
+                    return _INSPECTION_LIST_ADAPTER.validate_json(cached)
+            except Exception:
+                cache_key = None
+
+        statement = (
+            select(RoutineInspection)
+            .options(*_READ_LOADER_OPTIONS)
+            .where(RoutineInspection.deleted_at.is_(None))  # type: ignore
+        )
 
         if status is not None:
             statement = statement.where(RoutineInspection.status == status)
@@ -104,9 +160,17 @@ class _RoutineInspectionService:
         if site_id is not None:
             statement = statement.where(RoutineInspection.site_id == site_id)
 
-        statement = statement.offset(offset).limit(limit)
-        inspections = session.exec(statement).all()
-        return [self.inspection_to_response(inspection) for inspection in inspections]
+        # Stream rows through a server-side cursor instead of materialising them all first
+        statement = statement.offset(offset).limit(limit).execution_options(yield_per=50)
+        to_response = self.inspection_to_response
+        responses = [to_response(inspection) for inspection in session.exec(statement)]
+
+        if cache_key is not None:
+            try:
+                r.setex(cache_key, INSPECTION_LIST_CACHE_TTL_SECONDS, _INSPECTION_LIST_ADAPTER.dump_json(responses))  # type: ignore[union-attr]
+            except Exception:
+                pass
+        return responses
 
     def update_inspection(
         self, inspection_id: UUID, data: RoutineInspectionUpdate, session: Session
@@ -128,9 +192,11 @@ class _RoutineInspectionService:
         inspection.touch()
 
         try:
+            session.flush()
+            response = self.inspection_to_response(inspection)
             session.commit()
-            session.refresh(inspection)
-            return self.inspection_to_response(inspection)
+            _invalidate_inspection_list_cache()
+            return response
         except IntegrityError as e:
             session.rollback()
             raise ConflictException(f"Error updating routine inspection: {e.orig}")
@@ -142,6 +208,7 @@ class _RoutineInspectionService:
         inspection = self._get_inspection(inspection_id, session)
         inspection.soft_delete()
         session.commit()
+        _invalidate_inspection_list_cache()
     
     def submit_inspection(self, inspection_id: UUID, session: Session) -> RoutineInspectionResponse:
         """Submit a routine inspection, marking it as completed"""
@@ -154,38 +221,27 @@ class _RoutineInspectionService:
         inspection.touch()
         
         try:
+            session.flush()
+            response = self.inspection_to_response(inspection)
             session.commit()
-            session.refresh(inspection)
+            _invalidate_inspection_list_cache()
             
             # Create notification for NOC operators about completion
-            from app.services.notification import _NotificationService
-            from app.models import User
-            from app.utils.enums import UserRole
-            
-            task = session.exec(select(Task).where(Task.id == inspection.task_id)).first()
-            site_name = task.site.name if task and task.site else "Unknown Site"
+            site_name = session.exec(
+                select(Site.name)
+                .join(Task, Task.site_id == Site.id)  # type: ignore
+                .where(Task.id == response.task_id)
+            ).first() or "Unknown Site"
             
-            notification_service = _NotificationService()
-            
-            noc_users = session.exec(
-                select(User).where(
-                    and_(
-                        User.role == UserRole.NOC,
-                        User.deleted_at.is_(None)
-                    )
-                )
-            ).all()
-            
-            for noc_user in noc_users:
-                notification_service.create_notification_for_user(
-                    user_id=noc_user.id,
-                    title="Generator Routine Inspection Completed: " + site_name,
-                    message=f"Site: {site_name}\nThe routine inspection has been submitted.",
-                    priority=NotificationPriority.NORMAL,
-                    session=session
-                )
+            _NOTIFICATION_SERVICE.create_notifications_for_users(
+                get_noc_user_ids(session),
+                title="Generator Routine Inspection Completed: " + site_name,
+                message=f"Site: {site_name}\nThe routine inspection has been submitted.",
+                priority=NotificationPriority.NORMAL,
+                session=session
+            )
             
-            return self.inspection_to_response(inspection)
+            return response
         except IntegrityError as e:
             session.rollback()
             raise ConflictException(f"Error submitting routine inspection: {e.orig}")
@@ -193,9 +249,12 @@ class _RoutineInspectionService:
             session.rollback()
             raise InternalServerErrorException(f"Unexpected error submitting routine inspection: {e}")
 
-    def _get_inspection(self, inspection_id: UUID, session: Session) -> RoutineInspection:
+    def _get_inspection(self, inspection_id: UUID, session: Session, strict: bool = False) -> RoutineInspection:
+        """Load an inspection with its response relationships; `strict` is for read-only callers."""
         inspection = session.exec(
-            select(RoutineInspection).where(
+            select(RoutineInspection)
+            .options(*(_READ_LOADER_OPTIONS if strict else _INSPECTION_LOADER_OPTIONS))
+            .where(
                 and_(
                     RoutineInspection.id == inspection_id,
                     RoutineInspection.deleted_at.is_(None)
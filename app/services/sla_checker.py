@@ -18,10 +18,11 @@ from datetime import datetime, timedelta
 from typing import List, Tuple
 from sqlmodel import Session, select
 from sqlalchemy import and_
+from loguru import logger as LOG
 
 from app.utils.enums import IncidentStatus, NotificationPriority
 from app.utils.funcs import utcnow
-from app.models import Incident, User, Notification
+from app.models import Incident, User, Notification, Site, Technician
 
 
 # SLA thresholds in hours based on priority (extracted from description)
@@ -33,9 +34,16 @@ SLA_THRESHOLDS = {
     "default": 8,     # Default if no priority found
 }
 
+# Upper-case labels for notification messages, computed once per priority
+PRIORITY_LABELS = {priority: priority.upper() for priority in SLA_THRESHOLDS}
+
 # Warning threshold - notify when this percentage of SLA time has elapsed
 WARNING_THRESHOLD = 0.75  # 75%
 
+# No priority warns earlier than this after start, so younger incidents are
+# filtered out in SQL instead of being loaded and compared in Python.
+EARLIEST_WARNING = timedelta(hours=min(SLA_THRESHOLDS.values()) * WARNING_THRESHOLD)
+
 
 def extract_priority_from_description(description: str) -> str:
     """Extract priority level from incident description format: [PRIORITY] description"""
@@ -55,16 +63,18 @@ def extract_priority_from_description(description: str) -> str:
     return "default"
 
 
-def get_sla_deadline(incident: Incident) -> datetime:
+def get_sla_deadline(incident: Incident, priority: str | None = None) -> datetime:
     """Calculate the SLA deadline for an incident based on its priority."""
-    priority = extract_priority_from_description(incident.description)
+    if priority is None:
+        priority = extract_priority_from_description(incident.description)
     sla_hours = SLA_THRESHOLDS.get(priority, SLA_THRESHOLDS["default"])
     return incident.start_time + timedelta(hours=sla_hours)
 
 
-def get_warning_time(incident: Incident) -> datetime:
+def get_warning_time(incident: Incident, priority: str | None = None) -> datetime:
     """Calculate when to send a warning notification (75% of SLA time elapsed)."""
-    priority = extract_priority_from_description(incident.description)
+    if priority is None:
+        priority = extract_priority_from_description(incident.description)
     sla_hours = SLA_THRESHOLDS.get(priority, SLA_THRESHOLDS["default"])
     warning_hours = sla_hours * WARNING_THRESHOLD
     return incident.start_time + timedelta(hours=warning_hours)
@@ -77,31 +87,53 @@ def check_sla_breaches(session: Session) -> Tuple[List[dict], List[dict]]:
     Returns:
         Tuple of (warnings, breaches) where each is a list of incident info dicts
     """
-    from app.services.notification import _NotificationService
     from app.services.webhook import WebhookService
     import asyncio
-    notification_service = _NotificationService()
     
+    # Shared by every incident checked in this run
     now = utcnow()
+    now_iso = now.isoformat()
     warnings = []
     breaches = []
+    # Technician notifications for the whole sweep, written in one commit
+    notifications: List[Notification] = []
     
-    # Get all open incidents (not started or resolved)
+    # Get open incidents (not started or resolved) old enough to be in a warning zone
     statement = select(Incident).where(
         and_(
             Incident.status == IncidentStatus.OPEN,
-            Incident.deleted_at.is_(None)
+            Incident.deleted_at.is_(None),
+            Incident.start_time <= now - EARLIEST_WARNING
         )
     )
     open_incidents = session.exec(statement).all()
     
+    # Resolve site and technician names for all incidents with one IN-query each
+    site_ids = {incident.site_id for incident in open_incidents}
+    technician_ids = {incident.technician_id for incident in open_incidents}
+    site_names = dict(
+        session.exec(select(Site.id, Site.name).where(Site.id.in_(site_ids))).all()  # type: ignore
+    ) if site_ids else {}
+    technicians = {
+        technician_id: (f"{name} {surname}", user_id)
+        for technician_id, user_id, name, surname in session.exec(
+            select(Technician.id, Technician.user_id, User.name, User.surname)
+            .join(User, Technician.user_id == User.id)  # type: ignore
+            .where(
+                Technician.id.in_(technician_ids),  # type: ignore
+                Technician.deleted_at.is_(None),  # type: ignore
+                User.deleted_at.is_(None),  # type: ignore
+            )
+        ).all()
+    } if technician_ids else {}
+    
     for incident in open_incidents:
         priority = extract_priority_from_description(incident.description)
-        sla_deadline = get_sla_deadline(incident)
-        warning_time = get_warning_time(incident)
+        sla_deadline = get_sla_deadline(incident, priority)
+        warning_time = get_warning_time(incident, priority)
         
-        site_name = incident.site.name if incident.site else "Unknown Site"
-        tech_name = f"{incident.technician.user.name} {incident.technician.user.surname}" if incident.technician else "Unknown"
+        site_name = site_names.get(incident.site_id, "Unknown Site")
+        tech_name, tech_user_id = technicians.get(incident.technician_id, ("Unknown", None))
         
         # Check if SLA has been breached
         if now >= sla_deadline:
@@ -113,19 +145,18 @@ def check_sla_breaches(session: Session) -> Tuple[List[dict], List[dict]]:
                 "sla_deadline": sla_deadline.isoformat(),
                 "time_overdue": str(now - sla_deadline),
                 "event_type": "sla_breach",
-                "timestamp": now.isoformat()
+                "timestamp": now_iso
             }
             breaches.append(breach_data)
             
             # Send breach notification to technician
-            if incident.technician and incident.technician.user_id:
-                notification_service.create_notification_for_user(
-                    user_id=incident.technician.user_id,
+            if tech_user_id:
+                notifications.append(Notification(
+                    user_id=tech_user_id,
                     title=f"⚠️ SLA BREACHED: {site_name}",
-                    message=f"URGENT: The incident at {site_name} has BREACHED its {priority.upper()} priority SLA. Please attend immediately or escalate.",
+                    message=f"URGENT: The incident at {site_name} has BREACHED its {PRIORITY_LABELS[priority]} priority SLA. Please attend immediately or escalate.",
                     priority=NotificationPriority.CRITICAL,
-                    session=session
-                )
+                ))
             
             # Send webhook for breach
             import threading
@@ -149,12 +180,12 @@ def check_sla_breaches(session: Session) -> Tuple[List[dict], List[dict]]:
                 "sla_deadline": sla_deadline.isoformat(),
                 "time_remaining_minutes": minutes_remaining,
                 "event_type": "sla_warning",
-                "timestamp": now.isoformat()
+                "timestamp": now_iso
             }
             warnings.append(warning_data)
             
             # Send warning notification to technician
-            if incident.technician and incident.technician.user_id:
+            if tech_user_id:
                 if minutes_remaining < 60:
                     time_str = f"{minutes_remaining} minutes"
                 else:
@@ -162,13 +193,12 @@ def check_sla_breaches(session: Session) -> Tuple[List[dict], List[dict]]:
                     mins = minutes_remaining % 60
                     time_str = f"{hours}h {mins}m"
                 
-                notification_service.create_notification_for_user(
-                    user_id=incident.technician.user_id,
+                notifications.append(Notification(
+                    user_id=tech_user_id,
                     title=f"⏰ SLA Warning: {site_name}",
-                    message=f"Incident at {site_name} ({priority.upper()} priority) will breach SLA in {time_str}. Please start work on this incident immediately.",
+                    message=f"Incident at {site_name} ({PRIORITY_LABELS[priority]} priority) will breach SLA in {time_str}. Please start work on this incident immediately.",
                     priority=NotificationPriority.HIGH,
-                    session=session
-                )
+                ))
             
             # Send webhook for warning
             import threading
@@ -179,15 +209,39 @@ def check_sla_breaches(session: Session) -> Tuple[List[dict], List[dict]]:
             thread.daemon = True
             thread.start()
     
+    if notifications:
+        try:
+            session.add_all(notifications)
+            session.commit()
+        except Exception as e:
+            session.rollback()
+            LOG.warning(f"SLA Check: batched notification insert failed, retrying one by one: {e}")
+            _add_notifications_individually(notifications, session)
+    
     return warnings, breaches
 
 
+def _add_notifications_individually(notifications: List[Notification], session: Session) -> None:
+    """Insert each notification in its own savepoint so one bad row only loses itself."""
+    for notification in notifications:
+        try:
+            with session.begin_nested():
+                session.add(notification)
+        except Exception as e:
+            LOG.error(f"SLA Check: dropped notification for user {notification.user_id}: {e}")
+    try:
+        session.commit()
+    except Exception as e:
+        session.rollback()
+        LOG.error(f"SLA Check: failed to commit notifications: {e}")
+
+
 def get_sla_status_for_incident(incident: Incident) -> dict:
     """Get the SLA status for a single incident."""
     now = utcnow()
     priority = extract_priority_from_description(incident.description)
-    sla_deadline = get_sla_deadline(incident)
-    warning_time = get_warning_time(incident)
+    sla_deadline = get_sla_deadline(incident, priority)
+    warning_time = get_warning_time(incident, priority)
     
     if incident.status == IncidentStatus.RESOLVED:
         status = "resolved"
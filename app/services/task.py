@@ -1,19 +1,30 @@
 from uuid import UUID
-from fastapi import Depends
+from datetime import datetime
+from fastapi import Depends, BackgroundTasks
 from typing import List, Annotated
 from sqlmodel import Session, select
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy import and_
+from sqlalchemy.orm import selectinload
+from sqlalchemy import tuple_
 
-from app.utils.enums import TaskType, TaskStatus, NotificationPriority, ReportType, ReportStatus, UserRole
-from app.models import Task, TaskCreate, TaskUpdate, TaskResponse, Site, Technician, NotificationCreate, User, Report, ReportCreate
+from app.utils.enums import TaskType, TaskStatus, NotificationPriority, ReportType, ReportStatus
+from app.utils.funcs import preview
+from app.models import Task, TaskCreate, TaskUpdate, TaskResponse, Site, Technician, Notification, NotificationCreate, Report, ReportCreate
+from app.services.notification import _NotificationService
 from app.exceptions.http import (
     ConflictException,
     InternalServerErrorException,
     NotFoundException,
+    UnprocessableEntityException,
 )
 
 
+_NOTIFICATION_SERVICE = _NotificationService()
+
+# Upper bound on one POST /tasks/batch: every item is inserted, and notified, in a single transaction.
+MAX_TASK_BATCH_SIZE: int = 500
+
+
 class _TaskService:
     def task_to_response(self, task: Task) -> TaskResponse:
         user = task.technician.user
@@ -25,7 +36,7 @@ class _TaskService:
             site_region=task.site.region
             )
 
-    def create_task(self, data: TaskCreate, session: Session) -> TaskResponse:
+    def create_task(self, data: TaskCreate, session: Session, background_tasks: BackgroundTasks) -> TaskResponse:
         # Handle site
         statement = select(Site).where(Site.id == data.site_id, Site.deleted_at.is_(None)) # type: ignore
         site: Site | None = session.exec(statement).first()
@@ -43,25 +54,81 @@ class _TaskService:
             session.add(task)
             session.commit()
             session.refresh(task)
-            
-            # Create notification for technician
-            from app.services.notification import _NotificationService
-            notification_service = _NotificationService()
-            notification_service.create_notification_for_user(
+        except IntegrityError as e:
+            session.rollback()
+            raise ConflictException(f"Error creating task: {e.orig}")
+        except Exception as e:
+            session.rollback()
+            raise InternalServerErrorException(f"Unexpected error creating task: {e}")
+
+        # Notify the technician of the new task
+        background_tasks.add_task(
+            _NOTIFICATION_SERVICE.notify_users,
+            [technician.user_id],
+            f"New Task Assigned: {site.name}",
+            f"Task assigned at {site.name}. {preview(data.description, 100)}",
+            NotificationPriority.HIGH,
+        )
+
+        return self.task_to_response(task)
+
+    def create_tasks(self, items: List[TaskCreate], session: Session) -> List[TaskResponse]:
+        """Create many tasks, and their technician notifications, in one transaction."""
+        if not items:
+            return []
+        if len(items) > MAX_TASK_BATCH_SIZE:
+            raise UnprocessableEntityException(f"at most {MAX_TASK_BATCH_SIZE} tasks can be created per batch")
+
+        # Resolve every referenced site and technician with one IN-query each
+        site_ids = {item.site_id for item in items}
+        technician_ids = {item.technician_id for item in items}
+        sites = {
+            site.id: site
+            for site in session.exec(
+                select(Site).where(Site.id.in_(site_ids), Site.deleted_at.is_(None))  # type: ignore
+            )
+        }
+        technicians = {
+            technician.id: technician
+            for technician in session.exec(
+                select(Technician)
+                .options(selectinload(Technician.user))  # type: ignore
+                .where(Technician.id.in_(technician_ids), Technician.deleted_at.is_(None))  # type: ignore
+            )
+        }
+        if site_ids - sites.keys():
+            raise NotFoundException("site not found")
+        if technician_ids - technicians.keys():
+            raise NotFoundException("technician not found")
+
+        tasks: List[Task] = []
+        notifications: List[Notification] = []
+        for item in items:
+            site = sites[item.site_id]
+            technician = technicians[item.technician_id]
+            tasks.append(Task(**item.model_dump(), site=site, technician=technician))
+            notifications.append(Notification(
                 user_id=technician.user_id,
                 title=f"New Task Assigned: {site.name}",
-                message=f"Task assigned at {site.name}. {data.description[:100]}...",
+                message=f"Task assigned at {site.name}. {preview(item.description, 100)}",
                 priority=NotificationPriority.HIGH,
-                session=session
-            )
-            
-            return self.task_to_response(task)
+            ))
+
+        try:
+            # Primary keys are generated client-side, so the flush batches each
+            # table into a single multi-row INSERT.
+            session.add_all(tasks)
+            session.add_all(notifications)
+            session.flush()
+            responses = [self.task_to_response(task) for task in tasks]
+            session.commit()
+            return responses
         except IntegrityError as e:
             session.rollback()
-            raise ConflictException(f"Error creating task: {e.orig}")
+            raise ConflictException(f"Error creating tasks: {e.orig}")
         except Exception as e:
             session.rollback()
-            raise InternalServerErrorException(f"Unexpected error creating task: {e}")
+            raise InternalServerErrorException(f"Unexpected error creating tasks: {e}")
 
     def read_task(self, task_id: UUID, session: Session) -> TaskResponse:
         task = self._get_task(task_id, session)
@@ -75,6 +142,8 @@ class _TaskService:
         status: TaskStatus | None = None,
         offset: int = 0,
         limit: int = 100,
+        after_start_time: datetime | None = None,
+        after_id: UUID | None = None,
     ) -> List[TaskResponse]:
         statement = select(Task).where(Task.deleted_at.is_(None))  # type: ignore
 
@@ -85,7 +154,17 @@ class _TaskService:
         if status is not None:
             statement = statement.where(Task.status == status)
 
-        statement = statement.offset(offset).limit(limit)
+        # Keyset pagination: resume after the last (start_time, id) seen so deep
+        # pages use the schedule index instead of skipping `offset` rows.
+        if (after_start_time is None) != (after_id is None):
+            raise UnprocessableEntityException("after_start_time and after_id must be given together")
+        if after_start_time is not None:
+            statement = statement.where(
+                tuple_(Task.start_time, Task.id) > tuple_(after_start_time, after_id)
+            )
+            offset = 0
+
+        statement = statement.order_by(Task.start_time, Task.id).offset(offset).limit(limit)  # type: ignore
         tasks = session.exec(statement).all()
         return [self.task_to_response(task) for task in tasks]
 
@@ -121,45 +200,31 @@ class _TaskService:
         task.soft_delete()
         session.commit()
     
-    def start_task(self, task_id: UUID, session: Session) -> TaskResponse:
+    def start_task(self, task_id: UUID, session: Session, background_tasks: BackgroundTasks) -> TaskResponse:
         """Start a task and notify NOC operators."""
         task = self._get_task(task_id, session)
         task.start()
         try:
             session.commit()
             session.refresh(task)
-            
-            # Notify NOC operators that task has started
-            from app.services.notification import _NotificationService
-            notification_service = _NotificationService()
-            
-            noc_users = session.exec(
-                select(User).where(
-                    and_(
-                        User.role == UserRole.NOC,
-                        User.deleted_at.is_(None)
-                    )
-                )
-            ).all()
-            
-            site_name = task.site.name if task.site else "Unknown Site"
-            tech_name = f"{task.technician.user.name} {task.technician.user.surname}" if task.technician else "Unknown"
-            
-            for noc_user in noc_users:
-                notification_service.create_notification_for_user(
-                    user_id=noc_user.id,
-                    title=f"Task Started: {site_name}",
-                    message=f"{tech_name} has started working on task at {site_name}",
-                    priority=NotificationPriority.NORMAL,
-                    session=session
-                )
-            
-            return self.task_to_response(task)
         except Exception as e:
             session.rollback()
             raise InternalServerErrorException(f"Unexpected error starting task: {e}")
+
+        site_name = task.site.name if task.site else "Unknown Site"
+        tech_name = f"{task.technician.user.name} {task.technician.user.surname}" if task.technician else "Unknown"
+
+        # Notify NOC operators that task has started
+        background_tasks.add_task(
+            _NOTIFICATION_SERVICE.notify_noc,
+            f"Task Started: {site_name}",
+            f"{tech_name} has started working on task at {site_name}",
+            NotificationPriority.NORMAL,
+        )
+
+        return self.task_to_response(task)
     
-    def complete_task(self, task_id: UUID, session: Session) -> TaskResponse:
+    def complete_task(self, task_id: UUID, session: Session, background_tasks: BackgroundTasks) -> TaskResponse:
         """Complete a task, create auto-report, and notify NOC operators."""
         task = self._get_task(task_id, session)
         task.complete()
@@ -183,91 +248,62 @@ class _TaskService:
                     "task_description": task.description,
                     "site_name": site_name,
                     "completed_at": task.updated_at.isoformat() if task.updated_at else None,
-                    "task_type": str(task.task_type),
+                    "task_type": task.task_type.value,
                 }
             )
             session.add(report)
             session.commit()
-            session.refresh(report)
-            
-            # Notify NOC operators that task is completed
-            from app.services.notification import _NotificationService
-            notification_service = _NotificationService()
-            
-            noc_users = session.exec(
-                select(User).where(
-                    and_(
-                        User.role == UserRole.NOC,
-                        User.deleted_at.is_(None)
-                    )
-                )
-            ).all()
-            
-            site_name = task.site.name if task.site else "Unknown Site"
-            tech_name = f"{task.technician.user.name} {task.technician.user.surname}" if task.technician else "Unknown"
-            
-            for noc_user in noc_users:
-                notification_service.create_notification_for_user(
-                    user_id=noc_user.id,
-                    title=f"Task Completed: {site_name}",
-                    message=f"{tech_name} completed task at {site_name}. Report auto-generated and ready for review.",
-                    priority=NotificationPriority.HIGH,
-                    session=session
-                )
-            
-            # Also notify the technician that their report was created
-            if task.technician and task.technician.user_id:
-                notification_service.create_notification_for_user(
-                    user_id=task.technician.user_id,
-                    title=f"Report Created",
-                    message=f"A {report_type} report has been auto-generated for your completed task at {site_name}. Please review and add any additional details.",
-                    priority=NotificationPriority.NORMAL,
-                    session=session
-                )
-            
-            return self.task_to_response(task)
         except Exception as e:
             session.rollback()
             raise InternalServerErrorException(f"Unexpected error completing task: {e}")
+
+        site_name = task.site.name if task.site else "Unknown Site"
+        tech_name = f"{task.technician.user.name} {task.technician.user.surname}" if task.technician else "Unknown"
+
+        # Notify NOC operators that task is completed
+        background_tasks.add_task(
+            _NOTIFICATION_SERVICE.notify_noc,
+            f"Task Completed: {site_name}",
+            f"{tech_name} completed task at {site_name}. Report auto-generated and ready for review.",
+            NotificationPriority.HIGH,
+        )
+
+        # Also notify the technician that their report was created
+        if task.technician and task.technician.user_id:
+            background_tasks.add_task(
+                _NOTIFICATION_SERVICE.notify_users,
+                [task.technician.user_id],
+                "Report Created",
+                f"A {report_type} report has been auto-generated for your completed task at {site_name}. Please review and add any additional details.",
+                NotificationPriority.NORMAL,
+            )
+
+        return self.task_to_response(task)
     
-    def fail_task(self, task_id: UUID, session: Session) -> TaskResponse:
+    def fail_task(self, task_id: UUID, session: Session, background_tasks: BackgroundTasks) -> TaskResponse:
         """Mark a task as failed and notify NOC operators."""
         task = self._get_task(task_id, session)
         task.fail()
         try:
             session.commit()
             session.refresh(task)
-            
-            # Notify NOC operators that task has failed
-            from app.services.notification import _NotificationService
-            notification_service = _NotificationService()
-            
-            noc_users = session.exec(
-                select(User).where(
-                    and_(
-                        User.role == UserRole.NOC,
-                        User.deleted_at.is_(None)
-                    )
-                )
-            ).all()
-            
-            site_name = task.site.name if task.site else "Unknown Site"
-            tech_name = f"{task.technician.user.name} {task.technician.user.surname}" if task.technician else "Unknown"
-            
-            for noc_user in noc_users:
-                notification_service.create_notification_for_user(
-                    user_id=noc_user.id,
-                    title=f"Task Failed: {site_name}",
-                    message=f"{tech_name} reported that the task at {site_name} could not be completed. Please review and reassign.",
-                    priority=NotificationPriority.CRITICAL,
-                    session=session
-                )
-            
-            return self.task_to_response(task)
         except Exception as e:
             session.rollback()
             raise InternalServerErrorException(f"Unexpected error failing task: {e}")
 
+        site_name = task.site.name if task.site else "Unknown Site"
+        tech_name = f"{task.technician.user.name} {task.technician.user.surname}" if task.technician else "Unknown"
+
+        # Notify NOC operators that task has failed
+        background_tasks.add_task(
+            _NOTIFICATION_SERVICE.notify_noc,
+            f"Task Failed: {site_name}",
+            f"{tech_name} reported that the task at {site_name} could not be completed. Please review and reassign.",
+            NotificationPriority.CRITICAL,
+        )
+
+        return self.task_to_response(task)
+
     def _get_task(self, task_id: UUID, session: Session) -> Task:
         statement = select(Task).where(Task.id == task_id, Task.deleted_at.is_(None))  # type: ignore
         task: Task | None = session.exec(statement).first()
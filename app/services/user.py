@@ -1,6 +1,7 @@
+import time
 from uuid import UUID
 from fastapi import Depends
-from typing import List, Annotated
+from typing import List, Annotated, Tuple
 from sqlmodel import Session, select
 from sqlalchemy.exc import IntegrityError
 
@@ -14,6 +15,30 @@ from app.exceptions.http import (
 from app.utils.enums import UserRole, UserStatus
 from app.core import SecurityUtils
 
+# In-process cache of active NOC operator ids used for notification fan-out.
+# Entries are (expires_at, ids) where expires_at is a time.monotonic() value.
+NOC_USER_IDS_TTL_SECONDS: float = 60.0
+_noc_user_ids_cache: Tuple[float, Tuple[UUID, ...]] | None = None
+
+
+def get_noc_user_ids(session: Session) -> Tuple[UUID, ...]:
+    """Return the ids of all active NOC operators, cached for a short TTL."""
+    global _noc_user_ids_cache
+    now = time.monotonic()
+    if _noc_user_ids_cache is not None and now < _noc_user_ids_cache[0]:
+        return _noc_user_ids_cache[1]
+
+    statement = select(User.id).where(User.role == UserRole.NOC, User.deleted_at.is_(None))  # type: ignore
+    noc_user_ids = tuple(session.exec(statement).all())
+    _noc_user_ids_cache = (now + NOC_USER_IDS_TTL_SECONDS, noc_user_ids)
+    return noc_user_ids
+
+
+def invalidate_noc_user_ids() -> None:
+    """Drop the cached NOC operator ids so the next lookup hits the database."""
+    global _noc_user_ids_cache
+    _noc_user_ids_cache = None
+
 
 class _UserService:
     def user_to_response(self, user: User) -> UserResponse:
@@ -28,6 +53,7 @@ class _UserService:
             session.add(user)
             session.commit()
             session.refresh(user)
+            invalidate_noc_user_ids()
             return self.user_to_response(user)
         except IntegrityError as e:
             session.rollback()
@@ -89,6 +115,7 @@ class _UserService:
         user = self._get_user(user_id, session)
         user.soft_delete()
         session.commit()
+        invalidate_noc_user_ids()
 
     def activate_user(self, user_id: UUID, session: Session) -> UserResponse:
         """"""
@@ -113,6 +140,7 @@ class _UserService:
         user = self._get_user(user_id, session)
         user.role = role
         session.commit()
+        invalidate_noc_user_ids()
         session.refresh(user)
         return self.user_to_response(user)
 
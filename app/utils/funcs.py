@@ -4,3 +4,15 @@ from datetime import datetime, timezone
 def utcnow() -> datetime:
     """Return the current date and time with a UTC timezone"""
     return datetime.now(tz=timezone.utc)
+
+
+_ELLIPSIS = "..."
+
+
+def preview(text: str | None, limit: int) -> str:
+    """Return the first `limit` characters of `text`, with an ellipsis only when it was cut."""
+    if not text:
+        return ""
+    if len(text) <= limit:
+        return text
+    return text[:limit].rstrip() + _ELLIPSIS
@@ -0,0 +1,53 @@
+-- Materialized snapshots of the aggregate-heavy management dashboard views.
+-- The dashboard reads the mv_* relations. The API rebuilds them every
+-- MATERIALIZED_VIEW_REFRESH_SECONDS (60s) from a background task started in
+-- app.main's lifespan via ManagementDashboardService.refresh_materialized_views();
+-- POST /dashboard/refresh-materialized-views forces a refresh on demand. Each
+-- snapshot needs a unique index so REFRESH ... CONCURRENTLY can run without
+-- blocking readers.
+-- Requires 01_create_management_dashboard_views.sql.
+
+-- ================================
+-- 1. EXECUTIVE SLA OVERVIEW (single row)
+-- ================================
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_executive_sla_overview AS
+SELECT * FROM v_executive_sla_overview;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_executive_sla_overview_last_updated
+  ON mv_executive_sla_overview(last_updated);
+
+-- ================================
+-- 2. REGIONAL SLA ANALYTICS
+-- ================================
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_regional_sla_analytics AS
+SELECT * FROM v_regional_sla_analytics;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_regional_sla_analytics_region
+  ON mv_regional_sla_analytics(region);
+
+-- ================================
+-- 3. SITE RISK & RELIABILITY
+-- ================================
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_site_risk_reliability AS
+SELECT * FROM v_site_risk_reliability;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_site_risk_reliability_site_id
+  ON mv_site_risk_reliability(site_id);
+
+-- ================================
+-- 4. TECHNICIAN PERFORMANCE
+-- ================================
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_technician_performance AS
+SELECT * FROM v_technician_performance;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_technician_performance_technician_id
+  ON mv_technician_performance(technician_id);
+
+-- ================================
+-- 5. SLA TREND ANALYSIS
+-- ================================
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_sla_trend_analysis AS
+SELECT * FROM v_sla_trend_analysis;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_sla_trend_analysis_date_type
+  ON mv_sla_trend_analysis(metric_date, metric_type);
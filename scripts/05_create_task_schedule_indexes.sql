@@ -0,0 +1,8 @@
+-- Partial indexes backing the task list ordering and keyset pagination
+-- (ORDER BY start_time, id; WHERE (start_time, id) > (:after_start_time, :after_id)).
+-- New databases get these from the Task model; run this on existing ones.
+CREATE INDEX IF NOT EXISTS ix_tasks_schedule
+  ON tasks(start_time, id) WHERE deleted_at IS NULL;
+
+CREATE INDEX IF NOT EXISTS ix_tasks_technician_schedule
+  ON tasks(technician_id, start_time, id) WHERE deleted_at IS NULL;
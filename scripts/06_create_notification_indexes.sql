@@ -0,0 +1,9 @@
+-- Partial indexes for the notification inbox queries
+-- (WHERE user_id = :id AND deleted_at IS NULL [AND read = false] ORDER BY created_at DESC).
+-- New databases get these from the Notification model; run this on existing ones.
+-- created_at stays ascending to match the model: a btree scans backwards for DESC.
+CREATE INDEX IF NOT EXISTS ix_notifications_user_created
+  ON notifications(user_id, created_at) WHERE deleted_at IS NULL;
+
+CREATE INDEX IF NOT EXISTS ix_notifications_unread
+  ON notifications(user_id, created_at) WHERE deleted_at IS NULL AND read = false;
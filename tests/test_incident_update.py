@@ -0,0 +1,37 @@
+from uuid import uuid4
+
+from app.models import IncidentUpdate
+from app.services.incident import _incident_update_values
+
+
+def test_unset_fields_are_not_updated():
+    data = IncidentUpdate.model_validate({"ref_no": "REF-1"})
+    assert _incident_update_values(data) == {"ref_no": "REF-1"}
+
+
+def test_explicit_null_clears_nullable_columns():
+    data = IncidentUpdate.model_validate({
+        "client_id": None,
+        "ref_no": None,
+        "seacom_ref": None,
+        "attachments": None,
+        "start_time": None,
+    })
+    assert _incident_update_values(data) == {
+        "client_id": None,
+        "ref_no": None,
+        "seacom_ref": None,
+        "attachments": None,
+        "start_time": None,
+    }
+
+
+def test_explicit_null_for_required_columns_is_ignored():
+    site_id = uuid4()
+    data = IncidentUpdate.model_validate({
+        "description": None,
+        "site_id": site_id,
+        "technician_id": None,
+        "ref_no": None,
+    })
+    assert _incident_update_values(data) == {"site_id": site_id, "ref_no": None}
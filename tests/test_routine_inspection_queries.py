@@ -0,0 +1,38 @@
+from contextlib import contextmanager
+
+from sqlalchemy import event
+
+from app.services import routine_inspection
+from app.services.routine_inspection import _RoutineInspectionService
+
+
+@contextmanager
+def count_queries(session):
+    """Count the statements sent to the database while the block runs."""
+    engine = session.get_bind()
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def test_listing_query_count_does_not_grow_with_rows(db_session, monkeypatch):
+    # Bypass the Redis listing cache so every call reaches the database
+    monkeypatch.setattr(routine_inspection, "get_redis", lambda: None)
+    service = _RoutineInspectionService()
+
+    counts = []
+    for limit in (1, 100):
+        with count_queries(db_session) as statements:
+            service.read_inspections(db_session, limit=limit)
+        db_session.expire_all()
+        counts.append(len(statements))
+
+    assert all(count <= 3 for count in counts)
+    assert counts[0] == counts[1]